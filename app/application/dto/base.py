@@ -1,6 +1,17 @@
 from dataclasses import dataclass
+from typing import dataclass_transform
 
 
-@dataclass(frozen=True)
+@dataclass_transform(frozen_default=True)
+def fast_frozen_dataclass[T](cls: type[T]) -> type[T]:
+    """Return slotted frozen dataclass.
+
+    Runtime immutability matches what type checkers assume, so DTOs stay
+    safe to share and their hash never changes.
+    """
+    return dataclass(slots=True, frozen=True)(cls)
+
+
+@fast_frozen_dataclass
 class DTO:
     """Base class for all input DTOs."""
@@ -1,11 +1,10 @@
-from dataclasses import dataclass
 from typing import Literal
 from uuid import UUID
 
-from app.application.dto.base import DTO
+from app.application.dto.base import DTO, fast_frozen_dataclass
 
 
-@dataclass(slots=True, frozen=True)
+@fast_frozen_dataclass
 class CreateUserInputDTO(DTO):
     username: str
     email: str
@@ -13,49 +12,49 @@ class CreateUserInputDTO(DTO):
     role: str
 
 
-@dataclass(slots=True, frozen=True)
+@fast_frozen_dataclass
 class CreateUserOutputDTO(DTO):
     id: str
     email: str
     role: str
 
-@dataclass(slots=True, frozen=True)
+@fast_frozen_dataclass
 class DeleteUserInputDTO(DTO):
-    id: str
+    id: UUID | str
 
-@dataclass(slots=True, frozen=True)
+@fast_frozen_dataclass
 class DeleteUserOutputDTO(DTO):
     msg: str
 
-@dataclass(slots=True, frozen=True)
+@fast_frozen_dataclass
 class UpdateUserInputDTO(DTO):
-    id: str
+    id: UUID | str
     username: str|None
     email: str|None
     password: str|None
     role: str|None
 
-@dataclass(slots=True, frozen=True)
+@fast_frozen_dataclass
 class UpdateUserOutputDTO(DTO):
     id: str
     username: str
     email: str
     role: str
 
-@dataclass(slots=True, frozen=True)
+@fast_frozen_dataclass
 class AuthRequestDTO(DTO):
     email: str
     raw_password: str
 
 
-@dataclass(slots=True, frozen=True)
+@fast_frozen_dataclass
 class AuthResponseDTO(DTO):
     user_id: str
     email: str
     role: str
 
 
-@dataclass(slots=True, frozen=True)
+@fast_frozen_dataclass
 class CredentialDTO(DTO):
     """Flat generic DTO for any kind of authentication artefact."""
 
@@ -67,7 +66,7 @@ class CredentialDTO(DTO):
     ]
     value: str | dict | list
 
-@dataclass(slots=True, frozen=True)
+@fast_frozen_dataclass
 class UserSessionDTO(DTO):
     "Session DTO"
     id: UUID
@@ -1,4 +1,5 @@
 from app.application.ports.presenters import AuthPresenter, Presenter, State
+from app.application.ports.repositories import UserSessionRepository
 from app.application.ports.services import AuthorizeService, PasswordHasher, PasswordVerifier
 from app.application.ports.uow import UnitOfWork
 from app.domain.services.services import UserIdGenerator
@@ -12,4 +13,5 @@ __all__ = [
     "Presenter",
     "State",
     "UnitOfWork",
+    "UserSessionRepository",
 ]
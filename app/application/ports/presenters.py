@@ -1,12 +1,11 @@
 from __future__ import annotations
 
-from enum import Enum, auto
-from typing import Protocol, runtime_checkable
+from enum import IntEnum, auto
 
 from app.application.dto.base import DTO
 
 
-class State(Enum):
+class State(IntEnum):
     """Operation result states."""
 
     OK = auto()
@@ -18,10 +17,11 @@ class State(Enum):
     BAD_RESPONSE = auto()
 
 
-@runtime_checkable
-class Presenter[D: DTO](Protocol):
+class Presenter[D: DTO]:
     """Presenter contract that emits success or failure output."""
 
+    __slots__ = ("_state", "response")
+
     _state: State | None
     response: D | str
 
@@ -67,6 +67,8 @@ class Presenter[D: DTO](Protocol):
 class AuthPresenter[D: DTO](Presenter[D]):
     """Presenter with extra forbidden handler."""
 
+    __slots__ = ()
+
     def forbidden(self, message: str) -> None:
         """Set forbidden state with message."""
         self._state = State.FORBIDDEN
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from app.domain.entities.base import Repository
+from app.domain.value_objects import UserId
+
+
+class UserSessionRepository(Repository):
+    """Repository contract for login sessions of users."""
+
+    async def delete_by_user_id(self, user_id: UserId) -> None:
+        """Delete all sessions of a user.
+
+        Args:
+            user_id: Owner of the sessions.
+        """
+        ...
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Protocol, TypeVar, runtime_checkable
+from typing import Protocol, TypeVar
 
 from app.domain.entities.base import Repository
 from app.domain.entities.user import User
@@ -11,14 +11,12 @@ from app.domain.value_objects import UserId, UserPasswordHash, UserRawPassword,
 from app.application.dto import CredentialDTO
 
 
-@runtime_checkable
 class PasswordHasher(Protocol):
     """Hash raw password to secure hash."""
 
     def hash(self, raw_password: UserRawPassword, /) -> UserPasswordHash: ...
 
 
-@runtime_checkable
 class PasswordVerifier(Protocol):
     """Return True when raw password matches stored hash."""
 
@@ -34,5 +32,5 @@ class AuthorizeService(ABC):
         self,
         user_id: UserId,
         user_role: UserRole,
-        required_roles: list[UserRole],
+        required_roles: frozenset[UserRole],
     ) -> None: ...
@@ -1,19 +1,20 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from contextlib import AbstractAsyncContextManager
 from types import TracebackType
-from typing import TypeVar, override
+from typing import Final, TypeVar
 
 from app.application.exceptions.base import ApplicationError
 from app.config.logging import get_logger
-from app.domain.entities.user.repo import Repository
+from app.domain.entities.user.repo import Repository, UserRepository
 from app.domain.exceptions.base import DomainError
 
 R = TypeVar("R", bound=Repository)
 
+_EXPECTED_ERRORS: Final = (DomainError, ApplicationError)
 
-class UnitOfWork(AbstractAsyncContextManager, ABC):
+
+class UnitOfWork(ABC):
     """Unit-of-Work abstraction around a transactional session."""
 
     logger = get_logger(__name__)
@@ -28,17 +29,17 @@ class UnitOfWork(AbstractAsyncContextManager, ABC):
     async def _close(self) -> None: ...
     @abstractmethod
     def get_repo(self, iface: type[R]) -> R: ...
+    @abstractmethod
+    def get_user_repo(self) -> UserRepository: ...
 
     """
         R: Repository interface bound to this UoW.
     """
 
-    @override
     async def __aenter__(self) -> UnitOfWork:
         await self._open()
         return self
 
-    @override
     async def __aexit__(
         self,
         exc_type: type[BaseException] | None,
@@ -49,7 +50,7 @@ class UnitOfWork(AbstractAsyncContextManager, ABC):
             if exc_type is None:
                 await self.commit()
             else:
-                if exc_type not in (DomainError, ApplicationError):
+                if not issubclass(exc_type, _EXPECTED_ERRORS):
                     self.logger.error(
                         {"event": "unhandled infra-layer error in UoW"}, exc_info=True
                     )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Callable, override
+import asyncio
+from typing import Callable, Final, override
 
 from app.application.dto import AuthRequestDTO, AuthResponseDTO
 from app.application.ports.presenters import Presenter
@@ -8,16 +9,20 @@ from app.application.ports.services import PasswordVerifier
 from app.application.ports.uow import UnitOfWork
 from app.application.use_cases.base import UseCase
 from app.config.logging import get_logger
-from app.domain.entities.user.repo import UserRepository
 from app.domain.exceptions import ValueObjectError
 from app.domain.value_objects import Email, UserRawPassword
 
+logger = get_logger(__name__)
+
+_AUTH_FAILED_BAD_EMAIL: Final = {"event": "auth_failed", "reason": "bad_email_format"}
+_AUTH_FAILED_USER_NOT_FOUND: Final = {"event": "auth_failed", "reason": "user_not_found"}
+_AUTH_FAILED_BAD_PASSWORD: Final = {"event": "auth_failed", "reason": "bad_password_format"}
+_AUTH_FAILED_PASSWORD_MISMATCH: Final = {"event": "auth_failed", "reason": "password_mismatch"}
+
 
 class AuthenticateUserUseCase(UseCase[AuthRequestDTO, AuthResponseDTO]):
     """Authenticate user by email and password."""
 
-    logger = get_logger(__name__)
-
     def __init__(
         self,
         uow_factory: Callable[[], UnitOfWork],
@@ -34,43 +39,39 @@ class AuthenticateUserUseCase(UseCase[AuthRequestDTO, AuthResponseDTO]):
         presenter: Presenter[AuthResponseDTO],
     ) -> None:
         """Validate credentials and emit auth result."""
+        failure = _AUTH_FAILED_BAD_EMAIL
         try:
+            email = Email(dto.email)
             async with self._uow_factory() as uow:
-                repo: UserRepository = uow.get_repo(UserRepository)
-                user = await repo.get_by_email(Email(dto.email))
-        except ValueObjectError:
-            presenter.unauthorized("Invalid credentials")
-            self.logger.warning(
-                {"event": "auth_failed", "reason": "bad_email_format"}
-            )
-            return
-
-        if user is None:
-            presenter.unauthorized("Invalid credentials")
-            self.logger.warning({"event": "auth_failed", "reason": "user_not_found"})
-            return
-
-        try:
-            ok = self._password_verifier.verify(
-                UserRawPassword(dto.raw_password), user.password_hash
-            )
+                user = await uow.get_user_repo().get_by_email(email)
+            if user is None:
+                self._reject(presenter, _AUTH_FAILED_USER_NOT_FOUND)
+                return
+            failure = _AUTH_FAILED_BAD_PASSWORD
+            raw_password = UserRawPassword(dto.raw_password)
         except ValueObjectError:
-            presenter.unauthorized("Invalid credentials")
-            self.logger.warning(
-                {"event": "auth_failed", "reason": "bad_password_format"}
-            )
+            self._reject(presenter, failure)
             return
 
-        if not ok:
-            presenter.unauthorized("Invalid credentials")
-            self.logger.warning({"event": "auth_failed", "reason": "password_mismatch"})
+        verified = await asyncio.to_thread(
+            self._password_verifier.verify, raw_password, user.password_hash
+        )
+        if not verified:
+            self._reject(presenter, _AUTH_FAILED_PASSWORD_MISMATCH)
             return
 
+        user_id = str(user.id)
         presenter.ok(
             AuthResponseDTO(
-                user_id=str(user.id),
+                user_id=user_id,
                 email=str(user.email),
                 role=str(user.role),
             )
         )
-        self.logger.info({"event": "auth_succeeded", "user_id": str(user.id)})
+        logger.info({"event": "auth_succeeded", "user_id": user_id})
+
+    @staticmethod
+    def _reject(presenter: Presenter[AuthResponseDTO], event: dict[str, str]) -> None:
+        """Emit unauthorized result and log the failure reason."""
+        presenter.unauthorized("Invalid credentials")
+        logger.warning(event)
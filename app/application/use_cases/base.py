@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 from abc import ABC
-from logging import Logger
-from typing import Callable, final, Any, cast
+from types import MappingProxyType
+from typing import Callable, ClassVar, Final, final, Any, cast
 
 from app.application.dto.base import DTO
 from app.application.exceptions import NotAuthenticatedError, NotAuthorizedError, NotFoundUserSessionError
@@ -15,12 +15,18 @@ from app.domain.entities.user.repo import UserRepository
 from app.domain.exceptions.base import DomainError
 from app.domain.value_objects import UserRole
 
-ROLE_POLICIES: dict[str, list[UserRole]] = {
-    "CreateUserUseCase": [UserRole.ADMIN],
-    "DeleteUserUseCase": [UserRole.ADMIN],
-    "UpdateUserUseCase": [UserRole.ADMIN, UserRole.NANAGER],
-    "ViewOrdersUseCase": [UserRole.ADMIN, UserRole.NANAGER, UserRole.USER],
-    "ViewPaymentsUseCase": [UserRole.ADMIN, UserRole.NANAGER],
+logger = get_logger(__name__)
+
+_ADMIN_ONLY: Final = frozenset({UserRole.ADMIN})
+_STAFF: Final = frozenset({UserRole.ADMIN, UserRole.NANAGER})
+_ANY_ROLE: Final = frozenset(UserRole)
+
+ROLE_POLICIES: dict[str, frozenset[UserRole]] = {
+    "CreateUserUseCase": _ADMIN_ONLY,
+    "DeleteUserUseCase": _ADMIN_ONLY,
+    "UpdateUserUseCase": _STAFF,
+    "ViewOrdersUseCase": _ANY_ROLE,
+    "ViewPaymentsUseCase": _STAFF,
 }
 
 class UseCase[I: DTO, O: DTO](ABC):
@@ -33,8 +39,23 @@ class AuthorizeUserUseCase[I: DTO, O: DTO](ABC):
     """Use case base that checks authentication and role before execution."""
 
     _auth: AuthorizeService
+    _required_roles: ClassVar[frozenset[UserRole] | None] = None
+    _cls_name: ClassVar[str]
+    _access_denied_event: ClassVar[MappingProxyType[str, str]]
+
 
-    logger: Logger = get_logger(__name__)
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Resolve role policy once per concrete use case class."""
+        super().__init_subclass__(**kwargs)
+        cls._cls_name = cls.__name__
+        cls._required_roles = ROLE_POLICIES.get(cls._cls_name)
+        cls._access_denied_event = MappingProxyType(
+            {
+                "event": "access_denied",
+                "reason": "Insufficient role permissions",
+                "use_case": cls._cls_name,
+            }
+        )
 
     def __init__(
         self,
@@ -44,24 +65,17 @@ class AuthorizeUserUseCase[I: DTO, O: DTO](ABC):
         """Initialize with UoW factory, auth service and target role."""
         self._auth = auth_service
         self._user = user
-        self._required_roles: list[UserRole] | None = ROLE_POLICIES.get(self.__class__.__name__)
 
     @final
     async def execute(self, dto: I, presenter: AuthPresenter[O]) -> None:
     
+        if self._required_roles is None:
+            raise RuntimeError(f"No role policy for {self._cls_name}")
         try:
-            assert self._required_roles is not None
             self._auth.ensure_role(self._user.id, self._user.role, self._required_roles)
         except NotAuthorizedError:
             presenter.forbidden("Forbidden")
-            self.logger.warning(
-                {
-                    "event": "access_denied",
-                    "reason": "Insufficient role permissions",
-                    "use_case": f"{self.__class__.__name__}",
-                    "user_id": f"{self._user.id}",
-                }
-            )
+            logger.warning(self._access_denied_event | {"user_id": str(self._user.id)})
             return
 
         await self.run(dto, presenter)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+from types import MappingProxyType
 from typing import Callable, override
 
 from app.application.dto import CreateUserInputDTO, CreateUserOutputDTO
@@ -9,19 +11,18 @@ from app.application.ports.services import AuthorizeService, PasswordHasher
 from app.application.ports.uow import UnitOfWork
 from app.application.use_cases.base import AuthorizeUserUseCase
 from app.config.logging import get_logger
-from app.domain.entities.user.repo import UserRepository
 from app.domain.entities.user.user import User
 from app.domain.exceptions import ValueObjectError
 from app.domain.exceptions.base import DomainError
 from app.domain.services.services import UserIdGenerator
 from app.domain.value_objects import Username, UserRawPassword, UserRole, Email
 
+logger = get_logger(__name__)
+
 
 class CreateUserUseCase(AuthorizeUserUseCase[CreateUserInputDTO, CreateUserOutputDTO]):
     """Use case for creating new users (admin-only)."""
 
-    logger = get_logger(__name__)
-
     @override
     def __init__(
         self,
@@ -39,6 +40,9 @@ class CreateUserUseCase(AuthorizeUserUseCase[CreateUserInputDTO, CreateUserOutpu
         self._uow_factory = uow_factory
         self._hasher = hasher
         self._id_gen = id_gen
+        self._user_created_event = MappingProxyType(
+            {"event": "user_created", "use_case": self._cls_name}
+        )
 
     @override
     async def run(
@@ -49,12 +53,16 @@ class CreateUserUseCase(AuthorizeUserUseCase[CreateUserInputDTO, CreateUserOutpu
         """Validate input and create user in repository."""
         try:
             raw_password = UserRawPassword(dto.password)
-            pwd_hash = self._hasher.hash(raw_password)
+            username = Username(dto.username)
+            email = Email(dto.email)
+            role = UserRole(dto.role)
+            # Hash only valid input, off the event loop: bcrypt is CPU-bound.
+            pwd_hash = await asyncio.to_thread(self._hasher.hash, raw_password)
             user = User.create(
-                username=Username(dto.username),
-                email=Email(dto.email),
+                username=username,
+                email=email,
                 password_hash=pwd_hash,
-                role=UserRole(dto.role),
+                role=role,
                 id_gen=self._id_gen,
             )
         except (DomainError, ValueError, ValueObjectError) as e:
@@ -63,23 +71,18 @@ class CreateUserUseCase(AuthorizeUserUseCase[CreateUserInputDTO, CreateUserOutpu
 
         try:
             async with self._uow_factory() as uow:
-                repo = uow.get_repo(UserRepository)
+                repo = uow.get_user_repo()
                 await repo.add(user)
         except IntegrityUserError:
             presenter.conflict("User with given unique atributes already exists")
             return
 
+        user_id = str(user.id)
         presenter.ok(
             CreateUserOutputDTO(
-                id=str(user.id),
+                id=user_id,
                 email=str(user.email),
                 role=str(user.role),
             )
         )
-        self.logger.info(
-            {
-                "event": "user_created",
-                "use_case": self.__class__.__name__,
-                "user_id": str(user.id),
-            }
-        )
+        logger.info(self._user_created_event | {"user_id": user_id})
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Callable, override
-from dataclasses import fields
+from uuid import UUID
 
 from app.application.dto import UpdateUserInputDTO, UpdateUserOutputDTO
 from app.application.exceptions import IntegrityUserError
@@ -10,19 +11,18 @@ from app.application.ports.services import AuthorizeService, PasswordHasher
 from app.application.ports.uow import UnitOfWork
 from app.application.use_cases.base import AuthorizeUserUseCase
 from app.config.logging import get_logger
-from app.domain.entities.user.repo import UserRepository
 from app.domain.entities.user.user import User
 from app.domain.exceptions import ValueObjectError
 from app.domain.exceptions.base import DomainError
 from app.domain.services.services import UserIdGenerator
 from app.domain.value_objects import Username, UserRawPassword, UserRole, Email, UserId, UserPasswordHash
 
+logger = get_logger(__name__)
+
 
 class UpdateUserUseCase(AuthorizeUserUseCase[UpdateUserInputDTO, UpdateUserOutputDTO]):
     """Use case for update users (admin-only)."""
 
-    logger = get_logger(__name__)
-
     @override
     def __init__(
         self,
@@ -47,42 +47,57 @@ class UpdateUserUseCase(AuthorizeUserUseCase[UpdateUserInputDTO, UpdateUserOutpu
     ) -> None:
         """Validate input and delete user in repository."""
 
-        fields_to_update = {}
-        for f in fields(dto):
-            if f.name == "id":
-                continue
-            value = getattr(dto, f.name)
-            if value is not None:
-                fields_to_update[f.name] = value
-                
-        if not fields_to_update:
+        if (
+            dto.username is None
+            and dto.email is None
+            and dto.password is None
+            and dto.role is None
+        ):
             presenter.bad_response("Bad response.")
+            return
+
+        try:
+            user_id = (
+                UserId(dto.id) if isinstance(dto.id, UUID) else UserId.from_str(dto.id)
+            )
+        except ValueError:
+            presenter.not_found(f"User id:{dto.id} not found")
+            return
+
+        try:
+            username = Username(dto.username) if dto.username is not None else None
+            email = Email(dto.email) if dto.email is not None else None
+            role = UserRole(dto.role) if dto.role is not None else None
+            raw_password = (
+                UserRawPassword(dto.password) if dto.password is not None else None
+            )
+        except (ValueObjectError, ValueError):
+            presenter.error("Can`t update user with given atributes.")
+            return
 
         async with self._uow_factory() as uow:
-            repo = uow.get_repo(UserRepository)
-            user = await repo.get_by_id(UserId.from_str(dto.id))
+            repo = uow.get_user_repo()
+            user = await repo.get_by_id(user_id)
 
             if user is None:
                 presenter.not_found(f"User id:{dto.id} not found")
             else:
+                password_hash: UserPasswordHash | None = None
+                if raw_password is not None:
+                    # Hash only for an existing user, CPU-bound so keep it off the event loop.
+                    password_hash = await asyncio.to_thread(self._hasher.hash, raw_password)
+                try:
+                    user.apply_update(
+                        username=username,
+                        email=email,
+                        password_hash=password_hash,
+                        role=role,
+                    )
+                except DomainError:
+                    presenter.error("Can`t update user with given atributes.")
+                    return
+
                 try:
-                    for f in fields_to_update:
-                        try:
-                            match f:
-                                case "username":
-                                    user.change_username(Username(dto.username))
-                                case "email":
-                                    user.change_email(Email(dto.email))
-                                case "password":
-                                    pwd_hash = self._hasher.hash(UserRawPassword(dto.password))
-                                    user.change_password(pwd_hash)
-                                case "role":
-                                    user.change_role(UserRole(dto.role))
-                                case _:
-                                    raise ValueError("Not expected key in DTO.")
-                        except (DomainError, ValueObjectError, ValueError):
-                            presenter.error("Can`t update user with given atributes.")
-                            return
                     updated_user = await repo.save(user)
                 except IntegrityUserError:
                     presenter.conflict("User with given unique atributes already exists")
@@ -96,10 +111,10 @@ class UpdateUserUseCase(AuthorizeUserUseCase[UpdateUserInputDTO, UpdateUserOutpu
                         role=updated_user.role
                     )
                 )
-                self.logger.info(
+                logger.info(
                     {
                         "event": "user_updated",
-                        "use_case": self.__class__.__name__,
+                        "use_case": self._cls_name,
                         "user_id": str(user.id),
                         "username": user.username.value,
                         "email": user.email.value,
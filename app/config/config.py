@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import os
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from typing import ClassVar, Literal
 
 from pydantic import PostgresDsn, SecretStr, field_validator
@@ -30,6 +30,9 @@ class BaseConfig(BaseSettings):
     DB_USER: str
     DB_USER_SECRET: SecretStr
     DB_TABLE_SCHEMA: str
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_RECYCLE: int = 1800
 
     EFFECTIVE_MOBILE_TEST_APP_BOOTSTRAP_FLAG: bool
     EFFECTIVE_MOBILE_TEST_APP_BOOTSTRAP_ADMIN_USERNAME: str
@@ -46,9 +49,9 @@ class BaseConfig(BaseSettings):
             )
         return v
 
-    @property
+    @cached_property
     def DB_URL(self) -> PostgresDsn:
-        """Return built DSN."""
+        """Return built DSN, computed once per settings instance."""
         return PostgresDsn.build(
             scheme=self.DB_DRIVER,
             username=self.DB_USER,
@@ -5,6 +5,7 @@ import logging
 import traceback
 import os
 import sys
+from functools import lru_cache
 from logging.handlers import RotatingFileHandler
 from logging import StreamHandler
 from pathlib import Path
@@ -15,13 +16,18 @@ from app.config import get_settings
 class JsonFormatter(logging.Formatter):
     """Format log record as JSON string and mask sensitive fields."""
 
-    SENSITIVE_KEYS: Final[set[str]] = {
-        "username",
-        "password",
-        "token",
-        "secret_key",
-        "email",
-    }
+    SENSITIVE_KEYS: Final[frozenset[str]] = frozenset(
+        {
+            "username",
+            "password",
+            "token",
+            "secret_key",
+            "email",
+        }
+    )
+
+    # json.dumps() builds a new encoder per call when options are passed.
+    _ENCODER: Final = json.JSONEncoder(ensure_ascii=False, indent=2)
 
     def format(self, record: logging.LogRecord) -> str:
         """Return JSON-formatted record."""
@@ -33,8 +39,10 @@ class JsonFormatter(logging.Formatter):
 
         raw_msg = record.msg if isinstance(record.msg, dict) else record.getMessage()
         if isinstance(raw_msg, dict):
+            keys = self.SENSITIVE_KEYS
+            # Keys are usually lowercase literals, so try the exact match first.
             data["message"] = {
-                k: "[FILTERED]" if k.lower() in self.SENSITIVE_KEYS else v
+                k: "[FILTERED]" if k in keys or k.lower() in keys else v
                 for k, v in raw_msg.items()
             }
         else:
@@ -48,7 +56,7 @@ class JsonFormatter(logging.Formatter):
             }
             data["trace"] = traceback.format_exception(etype, evalue, tb)
 
-        return json.dumps(data, ensure_ascii=False, indent=2)
+        return self._ENCODER.encode(data)
 
 class LevelFilter(logging.Filter):
     def __init__(self, min_level: int | None = None, max_level: int | None = None):
@@ -64,6 +72,30 @@ class LevelFilter(logging.Filter):
         return True
 
 
+@lru_cache(maxsize=1)
+def _debug_enabled() -> bool:
+    """Return debug flag from settings, read on first use."""
+    return bool(get_settings().EFFECTIVE_MOBILE_TEST_APP_DEBUG)
+
+
+class DebugModeFilter(logging.Filter):
+    """Drop DEBUG records unless debug mode is enabled.
+
+    Settings are consulted on the first DEBUG record instead of at
+    import time, so creating loggers does not parse configuration.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno > logging.DEBUG or _debug_enabled()
+
+
+_FORMATTER: Final = JsonFormatter()
+_OUT_FILTER: Final = LevelFilter(max_level=logging.INFO)
+_ERR_FILTER: Final = LevelFilter(min_level=logging.WARNING)
+_DEBUG_FILTER: Final = DebugModeFilter()
+
+
+@lru_cache(maxsize=None)
 def get_logger(name: str) -> logging.Logger:
     """Return configured logger.
 
@@ -75,31 +107,22 @@ def get_logger(name: str) -> logging.Logger:
     """
     logger = logging.getLogger(name)
     logger.propagate = False
-    cfg = get_settings()
-    logger.setLevel(logging.DEBUG if cfg.EFFECTIVE_MOBILE_TEST_APP_DEBUG else logging.INFO)
+    logger.setLevel(logging.DEBUG)
 
+    # Handlers are attached once per name: results are cached.
     # Stdout handler: INFO and below
-    if not any(
-        isinstance(h, logging.StreamHandler)
-        and getattr(h, "stream", None) is sys.stdout
-        for h in logger.handlers
-    ):
-        sh_out = logging.StreamHandler(sys.stdout)
-        sh_out.setLevel(logging.DEBUG)
-        sh_out.addFilter(LevelFilter(max_level=logging.INFO))
-        sh_out.setFormatter(JsonFormatter())
-        logger.addHandler(sh_out)
+    sh_out = logging.StreamHandler(sys.stdout)
+    sh_out.setLevel(logging.DEBUG)
+    sh_out.addFilter(_OUT_FILTER)
+    sh_out.addFilter(_DEBUG_FILTER)
+    sh_out.setFormatter(_FORMATTER)
+    logger.addHandler(sh_out)
 
     # Stderr handler: WARNING and above
-    if not any(
-        isinstance(h, logging.StreamHandler)
-        and getattr(h, "stream", None) is sys.stderr
-        for h in logger.handlers
-    ):
-        sh_err = logging.StreamHandler(sys.stderr)
-        sh_err.setLevel(logging.WARNING)
-        sh_err.addFilter(LevelFilter(min_level=logging.WARNING))
-        sh_err.setFormatter(JsonFormatter())
-        logger.addHandler(sh_err)
+    sh_err = logging.StreamHandler(sys.stderr)
+    sh_err.setLevel(logging.WARNING)
+    sh_err.addFilter(_ERR_FILTER)
+    sh_err.setFormatter(_FORMATTER)
+    logger.addHandler(sh_err)
 
     return logger
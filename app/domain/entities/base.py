@@ -8,7 +8,7 @@ from app.domain.exceptions.base import DomainError
 from app.domain.value_objects.base import ValueObject
 
 
-@dataclass(eq=False, kw_only=True)
+@dataclass(eq=False, kw_only=True, slots=True)
 class Entity[T: ValueObject](ABC):
     """Domain entity identified by an immutable id.
 
@@ -23,7 +23,7 @@ class Entity[T: ValueObject](ABC):
         """Block changing id after initialization."""
         if name == "id" and getattr(self, "id", None) is not None:
             raise DomainError("Changing entity ID is not permitted.")
-        super().__setattr__(name, value)
+        object.__setattr__(self, name, value)
 
     @override
     def __eq__(self, other: Any) -> bool:
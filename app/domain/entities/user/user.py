@@ -8,7 +8,7 @@ from app.domain.services import UserIdGenerator
 from app.domain.value_objects import UserId, Username, UserPasswordHash, UserRole, Email
 
 
-@dataclass(eq=False, kw_only=True)
+@dataclass(eq=False, kw_only=True, slots=True)
 class User(Entity[UserId]):
     """Domain user entity.
 
@@ -136,6 +136,45 @@ class User(Entity[UserId]):
         if self.role is UserRole.ADMIN:
             self.is_active = True  # type: ignore[misc]
 
+    def apply_update(
+        self,
+        *,
+        username: Username | None = None,
+        email: Email | None = None,
+        password_hash: UserPasswordHash | None = None,
+        role: UserRole | None = None,
+    ) -> None:
+        """Apply several changes at once, leaving user untouched if any is rejected.
+
+        Args:
+            username: New username.
+            email: New email.
+            password_hash: New password hash.
+            role: New role.
+
+        Raises:
+            DomainError: When any given value is identical to current.
+        """
+        snapshot = (self.username, self.email, self.password_hash, self.role, self.is_active)
+        try:
+            if username is not None:
+                self.change_username(username)
+            if email is not None:
+                self.change_email(email)
+            if password_hash is not None:
+                self.change_password(password_hash)
+            if role is not None:
+                self.change_role(role)
+        except DomainError:
+            (
+                self.username,  # type: ignore[misc]
+                self.email,  # type: ignore[misc]
+                self.password_hash,  # type: ignore[misc]
+                self.role,  # type: ignore[misc]
+                self.is_active,  # type: ignore[misc]
+            ) = snapshot
+            raise
+
     def activate(self) -> None:
         """Activate account or raise if already active.
 
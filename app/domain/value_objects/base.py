@@ -1,27 +1,55 @@
 from __future__ import annotations
 
 from abc import ABC
-from dataclasses import asdict, dataclass, fields
-from typing import Any, override
+from dataclasses import dataclass, fields
+from functools import cache
+from typing import Any, Self, override
 
 from app.domain.exceptions import ValueObjectError
 
 
-@dataclass(frozen=True, repr=False)
+@dataclass(frozen=True, repr=False, slots=True)
 class ValueObject(ABC):
     """Immutable value object base type."""
 
     def __post_init__(self) -> None:
         """Ensure at least one field exists.
 
+        The field list is resolved once per class, not per instance.
+
         Raises:
             ValueObjectError: When the dataclass has no fields.
         """
-        if not fields(self):
+        if not self._field_names():
             raise ValueObjectError(
                 f"{type(self).__name__} must have at least one field!"
             )
 
+    @classmethod
+    def from_storage(cls, *values: Any) -> Self:
+        """Rehydrate value object from trusted storage without validation.
+
+        Args:
+            *values: Field values in definition order.
+
+        Returns:
+            Self: Value object instance.
+        """
+        obj = object.__new__(cls)
+        for name, value in zip(cls._field_names(), values, strict=True):
+            object.__setattr__(obj, name, value)
+        return obj
+
+    @classmethod
+    @cache
+    def _field_names(cls) -> tuple[str, ...]:
+        """Return dataclass field names, resolved once per class.
+
+        Returns:
+            tuple[str, ...]: Field names in definition order.
+        """
+        return tuple(f.name for f in fields(cls))
+
     @override
     def __repr__(self) -> str:
         """Return a compact textual representation.
@@ -37,10 +65,10 @@ class ValueObject(ABC):
         Returns:
             str: Field value string.
         """
-        all_fields = fields(self)
-        if len(all_fields) == 1:
-            return repr(getattr(self, all_fields[0].name))
-        return ", ".join(f"{f.name}={getattr(self, f.name)!r}" for f in all_fields)
+        names = self._field_names()
+        if len(names) == 1:
+            return repr(getattr(self, names[0]))
+        return ", ".join(f"{name}={getattr(self, name)!r}" for name in names)
 
     def get_fields(self) -> dict[str, Any]:
         """Return all field values as a dict.
@@ -48,4 +76,4 @@ class ValueObject(ABC):
         Returns:
             dict[str, Any]: Mapping of field names to values.
         """
-        return asdict(self)
+        return {name: getattr(self, name) for name in self._field_names()}
@@ -9,17 +9,18 @@ from app.domain.exceptions import ValueObjectError
 from app.domain.value_objects.base import ValueObject
 from app.domain.value_objects.constants import EMAIL_MAX_LEN, EMAIL_MIN_LEN
 
-EMAIL_REGEX = re.compile(r"^[^@\s]+@[^@\s]+\.[a-zA-Z0-9]+$")
+EMAIL_REGEX = re.compile(r"[^@\s]+@[^@\s]+\.[a-zA-Z0-9]+")
+_email_fullmatch = EMAIL_REGEX.fullmatch
 
 def validate_email_value(email_value: str) -> None:
     if not EMAIL_MIN_LEN <= len(email_value) <= EMAIL_MAX_LEN:
         raise ValueObjectError(
             f"Email must be between {EMAIL_MIN_LEN} and {EMAIL_MAX_LEN} characters."
         )
-    if not EMAIL_REGEX.match(email_value):
+    if "@" not in email_value or not _email_fullmatch(email_value):
                 raise ValueObjectError(f"Invalid email format: {email_value}")
 
-@dataclass(frozen=True, repr=False)
+@dataclass(frozen=True, repr=False, slots=True)
 class Email(ValueObject):
     """email value object.
 
@@ -35,7 +36,7 @@ class Email(ValueObject):
     @override
     def __post_init__(self) -> None:
         """Validate value length."""
-        super().__post_init__()
+        ValueObject.__post_init__(self)
         validate_email_value(self.value)
 
     @override
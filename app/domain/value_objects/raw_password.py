@@ -11,7 +11,7 @@ from app.domain.value_objects.constants import (
 )
 
 
-@dataclass(frozen=True, repr=False)
+@dataclass(frozen=True, repr=False, slots=True)
 class UserRawPassword(ValueObject):
     """User password in plain text.
 
@@ -27,11 +27,11 @@ class UserRawPassword(ValueObject):
     @override
     def __post_init__(self) -> None:
         """Validate value length."""
-        super().__post_init__()
+        ValueObject.__post_init__(self)
         length = len(self.value)
-        if length == 0:
-            raise ValueObjectError("Password must not be empty.")
         if not RAW_PASSWORD_MIN_LEN <= length <= RAW_PASSWORD_MAX_LEN:
+            if length == 0:
+                raise ValueObjectError("Password must not be empty.")
             raise ValueObjectError(
                 f"Password length must be {RAW_PASSWORD_MIN_LEN}-{RAW_PASSWORD_MAX_LEN} symbols."
             )
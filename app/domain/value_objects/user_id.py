@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import override
 from uuid import UUID, uuid4
 
 from app.domain.value_objects.base import ValueObject
 
 
-@dataclass(frozen=True, repr=False)
+@dataclass(frozen=True, repr=False, slots=True)
 class UserId(ValueObject):
     """User identifier value object.
 
@@ -36,9 +37,12 @@ class UserId(ValueObject):
         return UserId(uuid4())
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def from_str(v: str) -> UserId:
         """Construct identifier from string.
 
+        Results are cached, identifiers are immutable and safe to share.
+
         Args:
             v: UUID string.
 
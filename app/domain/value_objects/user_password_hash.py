@@ -8,7 +8,7 @@ from app.domain.value_objects.base import ValueObject
 from app.domain.value_objects.constants import HASH_LEN
 
 
-@dataclass(frozen=True, repr=False)
+@dataclass(frozen=True, repr=False, slots=True)
 class UserPasswordHash(ValueObject):
     """Password hash value object.
 
@@ -24,7 +24,7 @@ class UserPasswordHash(ValueObject):
     @override
     def __post_init__(self) -> None:
         """Validate hash length."""
-        super().__post_init__()
+        ValueObject.__post_init__(self)
         if not self.value:
             raise ValueObjectError("Password hash must not be empty.")
         if len(self.value) != HASH_LEN:
@@ -23,7 +23,7 @@ def validate_username_length(username_value: str) -> None:
         )
 
 
-@dataclass(frozen=True, repr=False)
+@dataclass(frozen=True, repr=False, slots=True)
 class Username(ValueObject):
     """Username value object.
 
@@ -39,7 +39,7 @@ class Username(ValueObject):
     @override
     def __post_init__(self) -> None:
         """Validate value length."""
-        super().__post_init__()
+        ValueObject.__post_init__(self)
         validate_username_length(self.value)
 
     @override
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Callable
+
+
+class TTLCache[K, V]:
+    """Bounded LRU mapping whose entries expire after a fixed time-to-live.
+
+    Intended for use from the event loop thread only.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        timer: Callable[[], float] = time.monotonic,
+        on_evict: Callable[[K, V], None] | None = None,
+    ) -> None:
+        """Initialize cache limits.
+
+        Args:
+            maxsize: Maximum number of entries kept.
+            ttl: Entry lifetime in seconds.
+            timer: Monotonic time source for tests.
+            on_evict: Called with each entry dropped by expiry, size limit,
+                pop or clear. Not called when a key is overwritten.
+        """
+        if maxsize <= 0:
+            raise ValueError("Cache maxsize must be positive.")
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._timer = timer
+        self._on_evict = on_evict
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def get(self, key: K) -> V | None:
+        """Return cached value or None when missing or expired."""
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at <= self._timer():
+            del self._data[key]
+            if self._on_evict is not None:
+                self._on_evict(key, value)
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        """Store value, evicting the least recently used entry when full.
+
+        Args:
+            key: Entry key.
+            value: Entry value.
+            ttl: Lifetime override, capped by the cache-wide ttl.
+        """
+        lifetime = self._ttl if ttl is None else min(ttl, self._ttl)
+        self._data[key] = (self._timer() + lifetime, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self._maxsize:
+            old_key, (_, old_value) = self._data.popitem(last=False)
+            if self._on_evict is not None:
+                self._on_evict(old_key, old_value)
+
+    def pop(self, key: K) -> None:
+        """Drop entry if present."""
+        item = self._data.pop(key, None)
+        if item is not None and self._on_evict is not None:
+            self._on_evict(key, item[1])
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        items = list(self._data.items())
+        self._data.clear()
+        if self._on_evict is not None:
+            for key, (_, value) in items:
+                self._on_evict(key, value)
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -1,10 +1,9 @@
 from __future__ import annotations
 
-import uuid
-from datetime import datetime
-from typing import Callable, ClassVar, TypeVar, override
+from typing import Any, Callable, ClassVar, TypeVar, cast, override
+from uuid import uuid4
 
-from sqlalchemy import select, update, func
+from sqlalchemy import CursorResult, delete, select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
@@ -12,13 +11,12 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
 )
 
-from app.application.dto import CredentialDTO, UserSessionDTO
 from app.application.exceptions import (
     IntegrityUserError,
-    NotAuthenticatedError,
     NotAuthorizedError,
-    ConcurrencyError
+    ConcurrencyError,
 )
+from app.application.ports.repositories import UserSessionRepository
 from app.application.ports.services import AuthorizeService
 from app.application.ports.uow import UnitOfWork
 from app.domain.entities.base import Repository
@@ -27,15 +25,23 @@ from app.domain.entities.user.repo import UserRepository
 from app.domain.services import UserIdGenerator
 from app.domain.value_objects import UserId, Username, UserPasswordHash, UserRole, Email
 from app.infrastructure.db.sqlalchemy.models.user import UserORM
-from app.infrastructure.security.jwt_service import (
-    JwtTokenExpired,
-    JwtTokenInvalid,
-    JwtTokenService,
-)
+from app.infrastructure.db.sqlalchemy.models.user_session import UserSessionORM
 
 type RepoFactory[R: Repository] = Callable[[AsyncSession], R]
 
 
+def _orm_to_user(row: UserORM) -> User:
+    """Map a trusted ORM row to a domain user."""
+    return User.from_storage(
+        id=UserId.from_storage(row.id),
+        username=Username.from_storage(row.username),
+        email=Email.from_storage(row.email),
+        password_hash=UserPasswordHash.from_storage(row.password_hash),
+        role=row.role,
+        is_active=row.is_active,
+    )
+
+
 class UserRepositorySQL(UserRepository):
     """SQLAlchemy repository that maps Domain to ORM and back."""
 
@@ -49,42 +55,26 @@ class UserRepositorySQL(UserRepository):
         result = await self._s.get(UserORM, user_id.value)
         if result is None:
             return None
-        return User.from_storage(
-            id=UserId(result.id),
-            username=Username(result.username),
-            email=Email(result.email),
-            password_hash=UserPasswordHash(result.password_hash),
-            role=UserRole(result.role),
-            is_active=result.is_active,
-        )
+        return _orm_to_user(result)
 
     @override
     async def get_by_email(self, email: Email) -> User | None:
         """Return a user by email or None."""
-        result = await self._s.scalars(
-            select(UserORM).where(UserORM.email == str(email))
-        )
-        row = result.first()
+        stmt = select(UserORM).where(UserORM.email == email.value).limit(1)
+        row = (await self._s.execute(stmt)).scalar_one_or_none()
         if row is None:
             return None
-        return User.from_storage(
-            id=UserId(row.id),
-            email=Email(row.email),
-            username=Username(row.username),
-            password_hash=UserPasswordHash(row.password_hash),
-            role=UserRole(row.role),
-            is_active=row.is_active,
-        )
+        return _orm_to_user(row)
 
     @override
     async def add(self, user: User) -> None:
         """Persist a new user or raise on conflict."""
         user_orm = UserORM(
             id=user.id.value,
-            username=str(user.username),
-            email=str(user.email),
+            username=user.username.value,
+            email=user.email.value,
             password_hash=user.password_hash.value,
-            role=str(user.role),
+            role=user.role,
             is_active=user.is_active,
         )
         try:
@@ -101,20 +91,29 @@ class UserRepositorySQL(UserRepository):
             role=user.role,
             is_active=user.is_active,
             password_hash=user.password_hash.value
-        ).returning(UserORM)
+        )
         try:
-            res = await self._s.execute(stmt)
-            rows = res.scalars().all()
+            res = cast(CursorResult[Any], await self._s.execute(stmt))
         except IntegrityError as e:
             raise IntegrityUserError(f"Integrity error occured when adding {user.id.value}") from e
-        if len(rows) != 1:
+        if res.rowcount != 1:
             raise ConcurrencyError("User was modified concurrently")
-        return User.from_storage(
-            id=UserId(rows[0].id),
-            username=Username(rows[0].username),
-            email=Email(rows[0].email),
-            password_hash=UserPasswordHash(rows[0].password_hash),
-            role=UserRole(rows[0].role)
+        # Stored values are exactly the ones taken from the entity.
+        return user
+
+
+class UserSessionRepositorySQL(UserSessionRepository):
+    """SQLAlchemy repository for user sessions."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Store session bound to current UoW transaction."""
+        self._s = session
+
+    @override
+    async def delete_by_user_id(self, user_id: UserId) -> None:
+        """Delete all sessions of a user."""
+        await self._s.execute(
+            delete(UserSessionORM).where(UserSessionORM.user_id == user_id.value)
         )
 
 
@@ -124,8 +123,9 @@ R = TypeVar("R", bound=Repository)
 class UoWSQL(UnitOfWork):
     """Unit-of-Work adapter for async SQLAlchemy."""
 
-    _REGISTRY: ClassVar[dict[Repository, RepoFactory[Repository]]] = {
+    _REGISTRY: ClassVar[dict[type[Repository], RepoFactory[Repository]]] = {
         UserRepository: lambda s: UserRepositorySQL(s),
+        UserSessionRepository: lambda s: UserSessionRepositorySQL(s),
     }
 
     def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
@@ -143,13 +143,15 @@ class UoWSQL(UnitOfWork):
     @override
     async def commit(self) -> None:
         """Commit active transaction."""
-        assert self._txn is not None, "No transaction started"
+        if self._txn is None:
+            raise RuntimeError("No transaction started")
         await self._txn.commit()
 
     @override
     async def rollback(self) -> None:
         """Rollback active transaction."""
-        assert self._txn is not None, "No transaction started"
+        if self._txn is None:
+            raise RuntimeError("No transaction started")
         await self._txn.rollback()
 
     @override
@@ -168,19 +170,24 @@ class UoWSQL(UnitOfWork):
         Returns:
             R: Repository bound to the active session.
         """
-        assert self._session is not None, "No session opened"
-        try:
-            factory = self._REGISTRY[iface]
-        except KeyError as e:
-            raise KeyError(f"Repository not registered: {iface!r}") from e
+        if self._session is None:
+            raise RuntimeError("No session opened")
+        factory = self._REGISTRY.get(iface)
+        if factory is None:
+            raise KeyError(f"Repository not registered: {iface!r}")
 
         repo = factory(self._session)
 
         # Safe cast: registry binds factory to iface type.
-        from typing import cast
-
         return cast(R, repo)
 
+    @override
+    def get_user_repo(self) -> UserRepository:
+        """Return user repository bound to current session."""
+        if self._session is None:
+            raise RuntimeError("No session opened")
+        return UserRepositorySQL(self._session)
+
 
 class UUIDv4Generator(UserIdGenerator):
     """Id generator that produces UUIDv4 values."""
@@ -188,16 +195,15 @@ class UUIDv4Generator(UserIdGenerator):
     @override
     def new(self) -> UserId:
         """Return a new UserId."""
-        return UserId(uuid.uuid4())
+        return UserId(uuid4())
 
 
 class RoleAuthService(AuthorizeService):
     """Auth facade using JWT and SQL repository."""
 
-
     @override
     def ensure_role(
-        self, user_id: UserId, user_role: UserRole, required_roles: list[UserRole]
+        self, user_id: UserId, user_role: UserRole, required_roles: frozenset[UserRole]
     ) -> None:
         """Raise when role is insufficient."""
         if user_role in required_roles:
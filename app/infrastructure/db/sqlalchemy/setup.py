@@ -11,9 +11,13 @@ def get_engine():
     cfg = get_settings()
     return create_async_engine(
         str(cfg.DB_URL),
-        connect_args={"server_settings": {"search_path": "app,public"}},
+        # JIT only adds planning overhead to short OLTP statements.
+        connect_args={"server_settings": {"search_path": "app,public", "jit": "off"}},
         echo=False,
         pool_pre_ping=True,
+        pool_size=cfg.DB_POOL_SIZE,
+        max_overflow=cfg.DB_MAX_OVERFLOW,
+        pool_recycle=cfg.DB_POOL_RECYCLE,
     )
 
 
@@ -24,3 +28,16 @@ def get_session_factory():
         get_engine(),
         expire_on_commit=False,
     )
+
+
+@lru_cache
+def get_readonly_session_factory():
+    """Lazy singleton session factory for single-statement reads.
+
+    Shares the engine pool but runs in AUTOCOMMIT, so no BEGIN/COMMIT
+    round-trips are issued around the query.
+    """
+    return async_sessionmaker(
+        get_engine().execution_options(isolation_level="AUTOCOMMIT"),
+        expire_on_commit=False,
+    )
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import hashlib
 from datetime import datetime, timedelta, timezone
 from typing import Any, Callable, Mapping, Sequence
 
 from jwt import ExpiredSignatureError, InvalidTokenError, decode, encode
 from pydantic import SecretStr
 
+from app.infrastructure.cache import TTLCache
+
 
 class JwtTokenError(Exception):
     """Base JWT service error."""
@@ -30,6 +33,8 @@ class JwtTokenService:
         required_claims: Sequence[str] = ("sub", "exp"),
         leeway: int | float = 0,
         clock: Callable[[], datetime] | None = None,
+        cache_size: int = 4096,
+        cache_ttl: float = 10.0,
     ) -> None:
         """Initialize service configuration.
 
@@ -40,15 +45,31 @@ class JwtTokenService:
             required_claims: Claims that must be present on decode().
             leeway: Allowed clock skew in seconds for exp verification.
             clock: Optional time source for tests.
+            cache_size: Max number of verified tokens kept in memory.
+            cache_ttl: Seconds a verified token skips signature check (0 disables).
         """
-        self._secret = secret
         self._algorithm = algorithm
+        # Configuration is fixed, resolve per-call arguments once.
+        self._key = secret.get_secret_value()
+        self._algorithms = [algorithm]
         if isinstance(default_expires, int):
             default_expires = timedelta(seconds=default_expires)
         self._default_expires = default_expires
-        self._required_claims = tuple(required_claims)
+        self._required_claims = frozenset(required_claims)
+        self._options: dict[bool, dict[str, Any]] = {
+            verify: {
+                "verify_signature": True,
+                "verify_exp": verify,
+                "require": list(self._required_claims),
+            }
+            for verify in (True, False)
+        }
         self._leeway = leeway
         self._clock = clock or self._utcnow
+        # Token string fully determines signature and claims, so its digest is a safe key.
+        self._cache: TTLCache[bytes, dict[str, Any]] | None = (
+            TTLCache(maxsize=cache_size, ttl=cache_ttl) if cache_ttl > 0 else None
+        )
 
     def issue(
         self,
@@ -76,7 +97,7 @@ class JwtTokenService:
 
         token = encode(
             payload=to_encode,
-            key=self._secret.get_secret_value(),
+            key=self._key,
             algorithm=self._algorithm,
             headers=dict(additional_headers) if additional_headers else None,
         )
@@ -96,17 +117,23 @@ class JwtTokenService:
         Returns:
             dict[str, Any]: Decoded claims.
         """
-        options = {
-            "verify_signature": True,
-            "verify_exp": verify_exp,
-            "require": list(self._required_claims),
-        }
+        cache = self._cache if verify_exp else None
+        if cache is not None:
+            key = self._cache_key(token)
+            cached = cache.get(key)
+            if cached is not None:
+                exp = cached.get("exp")
+                if exp is not None and exp <= self._clock().timestamp() - self._leeway:
+                    cache.pop(key)
+                    raise JwtTokenExpired("Signature has expired")
+                return dict(cached)
+
         try:
             payload = decode(
                 token,
-                key=self._secret.get_secret_value(),
-                algorithms=[self._algorithm],
-                options=options,
+                key=self._key,
+                algorithms=self._algorithms,
+                options=self._options[verify_exp],
                 leeway=self._leeway,
             )
         except ExpiredSignatureError as e:
@@ -114,12 +141,28 @@ class JwtTokenService:
         except InvalidTokenError as e:
             raise JwtTokenInvalid(str(e)) from None
 
-        # Defensive check in case library options change.
-        missing = [c for c in self._required_claims if c not in payload]
-        if missing:
-            raise JwtTokenInvalid(f"Missing required claims: {missing}")
+        # Required claims are enforced by PyJWT via options["require"].
+        if cache is not None:
+            self._remember(cache, token, dict(payload))
         return payload
 
+    def _remember(
+        self, cache: TTLCache[bytes, dict[str, Any]], token: str, claims: dict[str, Any]
+    ) -> None:
+        # Keep verified claims no longer than the token itself stays valid.
+        exp = claims.get("exp")
+        ttl = None
+        if isinstance(exp, (int, float)):
+            ttl = exp + self._leeway - self._clock().timestamp()
+            if ttl <= 0:
+                return
+        cache.set(self._cache_key(token), claims, ttl=ttl)
+
+    @staticmethod
+    def _cache_key(token: str) -> bytes:
+        # Raw bearer tokens are not kept in memory, only their digest.
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
     def _compute_exp(self, override: timedelta | int | None) -> datetime | None:
         # Compute absolute expiration timestamp or None.
         if override is None:
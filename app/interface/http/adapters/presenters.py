@@ -12,6 +12,10 @@ D = TypeVar("D", bound=DTO)
 class FastAPIAuthPresenter[D: DTO](AuthPresenter[D]):
     """Presenter for create-user responses."""
 
+    __slots__ = ()
+
 
 class FastAPIPresenter[D: DTO](Presenter[D]):
     """Presenter for authentication responses."""
+
+    __slots__ = ()
@@ -1,10 +1,11 @@
 # auth/adapters.py
 from __future__ import annotations
+import asyncio
 from datetime import datetime, timezone
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import select, and_, join, delete
+from sqlalchemy import select, and_, bindparam, func, join, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.infrastructure.db.sqlalchemy.models.user_session import UserSessionORM 
@@ -12,50 +13,140 @@ from app.infrastructure.db.sqlalchemy.models.user import UserORM
 
 from app.domain.entities.user import User
 from app.domain.value_objects import UserId, Username, Email, UserPasswordHash, UserRole
+from app.infrastructure.cache import TTLCache
+
+# один запрос: join sessions → users
+# Built once at import so SQLAlchemy reuses its compiled form.
+_SESSION_USER_STMT = (
+    select(
+        UserORM.id,
+        UserORM.username,
+        UserORM.email,
+        UserORM.password_hash,
+        UserORM.role,
+        UserORM.is_active,
+        UserSessionORM.expires_at,
+    )
+    .select_from(
+        join(UserSessionORM, UserORM, UserSessionORM.user_id == UserORM.id)
+    )
+    .where(
+        and_(
+            UserSessionORM.id == bindparam("sid"),
+            UserSessionORM.revoked_at.is_(None),
+            UserSessionORM.expires_at > func.now(),
+        )
+    )
+    .limit(1)
+)
+
+class _Flight:
+    """Lock shared by concurrent loads of one sid, with a count of its users."""
+
+    __slots__ = ("lock", "users")
+
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.users = 0
+
+
+type _UserRow = tuple[UUID, str, str, bytes, UserRole, bool]
+
 
 class SQLAuthenticateService:
-    async def get_user_by_session_id(self, db: AsyncSession, session_id: UUID) -> Optional[User]:
-        now = datetime.now(timezone.utc)
-
-        # один запрос: join sessions → users
-        stmt = (
-            select(
-                UserORM.id,
-                UserORM.username,
-                UserORM.email,
-                UserORM.password_hash,
-                UserORM.role,
-                UserORM.is_active,
-            )
-            .select_from(
-                join(UserSessionORM, UserORM, UserSessionORM.user_id == UserORM.id)
-            )
-            .where(
-                and_(
-                    UserSessionORM.id == session_id,
-                    UserSessionORM.revoked_at.is_(None),
-                    UserSessionORM.expires_at > now,
-                )
-            )
-            .limit(1)
+    """Resolve users by session id with a short-lived in-process cache.
+
+    Cached users may lag behind DB changes for at most ``cache_ttl`` seconds,
+    unless the writer calls ``invalidate_user`` after committing.
+    """
+
+    def __init__(self, cache_size: int = 10_000, cache_ttl: float = 5.0) -> None:
+        self._cache: TTLCache[UUID, tuple[_UserRow, datetime]] = TTLCache(
+            maxsize=cache_size, ttl=cache_ttl, on_evict=self._unindex
         )
+        self._sids_by_user: dict[UUID, set[UUID]] = {}
+        # Bumped on invalidation so loads that raced it do not re-cache stale rows.
+        self._generation = 0
+        self._flights: dict[UUID, _Flight] = {}
 
-        row = (await db.execute(stmt)).one_or_none()
-        if not row:
+    async def get_user_by_session_id(self, db: AsyncSession, session_id: UUID) -> Optional[User]:
+        cached = self._lookup(session_id)
+        if cached is not None:
+            return cached
+
+        # Single-flight: concurrent requests with the same sid issue one SELECT.
+        flight = self._flights.get(session_id)
+        if flight is None:
+            flight = self._flights[session_id] = _Flight()
+        flight.users += 1
+        try:
+            async with flight.lock:
+                cached = self._lookup(session_id)
+                if cached is not None:
+                    return cached
+                generation = self._generation
+                loaded = await self._load(db, session_id)
+                if loaded is None:
+                    return None
+                # The SELECT already filtered on expires_at > now().
+                user_row, _ = loaded
+                if generation == self._generation:
+                    self._cache.set(session_id, loaded)
+                    self._sids_by_user.setdefault(user_row[0], set()).add(session_id)
+                return self._to_user(user_row)
+        finally:
+            # Released lock may still have waiters queued, drop it after the last one.
+            flight.users -= 1
+            if flight.users == 0:
+                del self._flights[session_id]
+
+    def invalidate_user(self, user_id: UserId) -> None:
+        """Drop cached sessions of a user. Call after the change is committed."""
+        self._generation += 1
+        for sid in self._sids_by_user.pop(user_id.value, ()):
+            self._cache.pop(sid)
+
+    def _unindex(self, session_id: UUID, item: tuple[_UserRow, datetime]) -> None:
+        sids = self._sids_by_user.get(item[0][0])
+        if sids is None:
+            return
+        sids.discard(session_id)
+        if not sids:
+            del self._sids_by_user[item[0][0]]
+
+    def _lookup(self, session_id: UUID) -> Optional[User]:
+        item = self._cache.get(session_id)
+        if item is None:
+            return None
+        user_row, expires_at = item
+        if expires_at <= datetime.now(timezone.utc):
+            self._cache.pop(session_id)
             return None
+        # Fresh entity per hit, callers must not share mutable state through the cache.
+        return self._to_user(user_row)
 
+    @staticmethod
+    def _to_user(row: _UserRow) -> User:
         (u_id, u_username, u_email, u_hash, u_role, u_active) = row
-
-        # Ре-гидратация доменной сущности через твои VO
-        user = User.from_storage(
-            id=UserId(u_id),
-            username=Username(u_username),
-            email=Email(u_email),
-            password_hash=UserPasswordHash(u_hash),
-            role=UserRole(u_role),
-            is_active=bool(u_active),
+        # Row comes from our own schema, rehydrate without re-validating.
+        return User.from_storage(
+            id=UserId.from_storage(u_id),
+            username=Username.from_storage(u_username),
+            email=Email.from_storage(u_email),
+            password_hash=UserPasswordHash.from_storage(u_hash),
+            role=u_role,
+            is_active=u_active,
         )
-        return user
+
+    async def _load(self, db: AsyncSession, session_id: UUID) -> Optional[tuple[_UserRow, datetime]]:
+        row = (await db.execute(_SESSION_USER_STMT, {"sid": session_id})).one_or_none()
+        if not row:
+            return None
+
+        (u_id, u_username, u_email, u_hash, u_role, u_active, expires_at) = row
+        return (u_id, u_username, u_email, u_hash, u_role, u_active), expires_at
 
     async def delete_user_session_by_user_id(self, db: AsyncSession, user_id: UserId) -> None:
-        await db.execute(delete(UserSessionORM).where(UserSessionORM.user_id==user_id.value))
\ No newline at end of file
+        """Delete all sessions of a user. Caller invalidates the cache after commit."""
+        stmt = delete(UserSessionORM).where(UserSessionORM.user_id == user_id.value)
+        await db.execute(stmt)
@@ -21,3 +21,4 @@ class TokenService(Protocol):
 class AuthenticateService(Protocol):
     async def get_user_by_session_id(self, db: AsyncSession, session_id: UUID) -> Optional[User]: ...
     async def delete_user_session_by_user_id(self, db: AsyncSession, user_id: UserId) -> None: ...
+    def invalidate_user(self, user_id: UserId) -> None: ...
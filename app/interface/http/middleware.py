@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import hmac
+from typing import Final
+from uuid import UUID
+
+from fastapi import Response, status
+from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config.logging import get_logger
+from app.domain.entities.user import User
+from app.domain.value_objects import UserId
+from app.infrastructure.security.jwt_service import JwtTokenExpired, JwtTokenInvalid
+from app.interface.http.auth.ports import AuthenticateService, TokenService
+
+logger = get_logger(__name__)
+
+# Same bytes JSONResponse would render, serialized once.
+_UNAUTHORIZED_BODY: Final = b'{"detail":"Not authorized."}'
+
+
+def _unauthorized() -> Response:
+    """Return 401 response with a pre-encoded body."""
+    return Response(
+        content=_UNAUTHORIZED_BODY,
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        media_type="application/json",
+    )
+
+
+class AuthAndErrorMiddleware:
+    """Pure ASGI middleware that authenticates requests and converts crashes to 500.
+
+    Replaces two ``@app.middleware("http")`` layers, avoiding the per-request
+    task group and body streaming overhead of ``BaseHTTPMiddleware``.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        token_service: TokenService,
+        auth_service: AuthenticateService,
+        session_factory: async_sessionmaker[AsyncSession],
+        public_prefixes: tuple[str, ...],
+    ) -> None:
+        """Initialize with wrapped app and auth dependencies.
+
+        Args:
+            app: Wrapped ASGI application.
+            token_service: Service decoding bearer tokens.
+            auth_service: Service resolving users by session id.
+            session_factory: Factory for DB sessions used in the lookup.
+            public_prefixes: Path prefixes that skip authentication.
+        """
+        self.app = app
+        self._jwt = token_service
+        self._auth = auth_service
+        self._session_factory = session_factory
+        self._public_prefixes = public_prefixes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            if scope["method"] == "OPTIONS" or scope["path"].startswith(self._public_prefixes):
+                await self.app(scope, receive, send_wrapper)
+                return
+
+            user = await self._authenticate(HTTPConnection(scope))
+            if user is None:
+                await _unauthorized()(scope, receive, send_wrapper)
+                return
+
+            # Backs request.state.user in route dependencies.
+            scope.setdefault("state", {})["user"] = user
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
+            logger.error(
+                {
+                    "event": "unhandled_exception",
+                    "path": scope["path"],
+                    "method": scope["method"],
+                },
+                exc_info=True,
+            )
+            if response_started:
+                raise
+            response = JSONResponse(
+                status_code=500, content={"detail": "Internal server error"}
+            )
+            await response(scope, receive, send)
+
+    async def _authenticate(self, conn: HTTPConnection) -> User | None:
+        """Return user bound to bearer token and session cookie, or None."""
+        # Bearer токен
+        scheme, _, token = conn.headers.get("Authorization", "").partition(" ")
+        if scheme != "Bearer":
+            return None
+        # strip() returns the same object when there is nothing to remove.
+        token = token.strip()
+
+        # Декод и базовая валидация
+        try:
+            claims = self._jwt.decode(token, verify_exp=True)
+        except (JwtTokenExpired, JwtTokenInvalid):
+            return None
+
+        sub = claims.get("sub")
+        sid_str = claims.get("sid")
+        if not sub or not sid_str:
+            return None
+
+        # Cookie vs token sid
+        cookie_sid = conn.cookies.get("session_id")
+        if (
+            not cookie_sid
+            or not isinstance(sid_str, str)
+            # Constant-time compare, bytes avoid TypeError on non-ASCII input.
+            or not hmac.compare_digest(cookie_sid.encode(), sid_str.encode())
+        ):
+            return None
+
+        # Parse identifiers once, before touching the DB.
+        try:
+            sid = UUID(sid_str)
+            sub_vo = UserId.from_str(sub)
+        except (AttributeError, TypeError, ValueError):
+            return None
+
+        async with self._session_factory() as db:
+            user = await self._auth.get_user_by_session_id(db, sid)
+
+        # sub == user.id (VO)
+        if user is None or sub_vo != user.id:
+            return None
+        return user
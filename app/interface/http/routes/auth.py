@@ -6,6 +6,7 @@ from fastapi import APIRouter, Depends, Request, Response, Security, Form
 from fastapi.security import OAuth2PasswordRequestForm, HTTPAuthorizationCredentials
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy import insert
 from sqlalchemy.exc import IntegrityError
 
 from app.application.dto import AuthRequestDTO, AuthResponseDTO
@@ -67,30 +68,33 @@ async def login(
     Returns:
         Token: Bearer access token on success.
     """
-    presenter = FastAPIPresenter[AuthResponseDTO]()
+    presenter: FastAPIPresenter[AuthResponseDTO] = FastAPIPresenter()
     dto = AuthRequestDTO(email=form.email, raw_password=form.password)
     await uc.execute(dto, presenter)
     
-    if presenter.state is State.OK and isinstance(presenter.response, AuthResponseDTO):
-        user_session = UserSessionORM(
-            id=uuid4(),
-            user_id=presenter.response.user_id,
-            expires_at=datetime.now(timezone.utc) + timedelta(days=7)
-        )
+    if presenter.state is State.OK:
+        assert isinstance(presenter.response, AuthResponseDTO)
+        session_id = uuid4()
         async with session_factory() as db:
             async with db.begin():
-                db.add(user_session)
-                await db.flush()
+                # Core insert skips ORM unit-of-work bookkeeping for a single row.
+                await db.execute(
+                    insert(UserSessionORM).values(
+                        id=session_id,
+                        user_id=presenter.response.user_id,
+                        expires_at=datetime.now(timezone.utc) + timedelta(days=7),
+                    )
+                )
 
         token = token_service.issue(
-            claims={"sub": presenter.response.user_id, "role": presenter.response.role, "sid": str(user_session.id)}
+            claims={"sub": presenter.response.user_id, "role": presenter.response.role, "sid": str(session_id)}
         )
         logger.info(
             {"event": "token_created", "user_id": f"{presenter.response.user_id}"}
         )
         response.set_cookie(
             key="session_id",
-            value=str(user_session.id),
+            value=str(session_id),
             httponly=True,
             secure=True,
             samesite="lax",
@@ -125,5 +129,6 @@ async def logout(
     async with session_factory() as db:
         async with db.begin():
             await auth.delete_user_session_by_user_id(db, user.id)
+    auth.invalidate_user(user.id)
     return LogoutResponse(detail="Logout successfully.")
 
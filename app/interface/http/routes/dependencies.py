@@ -1,9 +1,9 @@
 from datetime import timedelta
-from functools import lru_cache
+from functools import lru_cache, partial
 from typing import Annotated, Callable
 
-from fastapi import Depends, Header, Request
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from fastapi import Depends, Header, HTTPException, Request, status
+from fastapi.security import HTTPBearer
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -29,7 +29,7 @@ from app.infrastructure.db.sqlalchemy.setup import get_session_factory
 from app.infrastructure.security.adapters import BcryptHasher, BcryptPasswordVerifier
 from app.infrastructure.security.jwt_service import JwtTokenService
 from app.interface.http.auth.adapters import SQLAuthenticateService
-from app.interface.http.auth.ports import AuthenticateService, TokenService
+from app.interface.http.auth.ports import AuthenticateService
 
 
 security: HTTPBearer = HTTPBearer()
@@ -49,26 +49,42 @@ def get_jwt_service() -> JwtTokenService:
     )
 
 
+@lru_cache
 def get_uow_factory() -> Callable[[], UnitOfWork]:
-    """Return factory that creates a new UnitOfWork per call."""
-    return lambda: UoWSQL(session_factory=get_session_factory())
+    """Return cached factory that creates a new UnitOfWork per call."""
+    return partial(UoWSQL, session_factory=get_session_factory())
 
 
+@lru_cache
 def get_hasher() -> PasswordHasher:
-    """Return password hasher implementation."""
+    """Return shared password hasher implementation."""
     return BcryptHasher()
 
 
+@lru_cache
 def get_id_gen() -> UserIdGenerator:
-    """Return identifier generator implementation."""
+    """Return shared identifier generator implementation."""
     return UUIDv4Generator()
 
 
+@lru_cache
 def get_verifier() -> PasswordVerifier:
-    """Return password verifier implementation."""
+    """Return shared password verifier implementation."""
     return BcryptPasswordVerifier()
 
 
+def get_current_user(request: Request) -> User:
+    """Return user attached to the request by the auth middleware."""
+    user = getattr(request.state, "user", None)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authorized.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return user
+
+
 def get_authenticate_user_uc(
     uow_factory: Annotated[Callable[[], UnitOfWork], Depends(get_uow_factory)],
     password_verifier: Annotated[PasswordVerifier, Depends(get_verifier)],
@@ -80,23 +96,23 @@ def get_authenticate_user_uc(
     )
 
 
-def get_authorize_service(credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)]) -> AuthorizeService:
-    """Return AuthService bound to JWT credentials."""
+@lru_cache(maxsize=1)
+def get_authorize_service() -> AuthorizeService:
+    """Return shared role-based authorization service.
 
+    Bearer token is validated by the auth middleware before routing.
+    """
     return RoleAuthService()
 
 
 def get_create_user_uc(
-    request: Request,
+    user: Annotated[User, Depends(get_current_user)],
     uow_factory: Annotated[Callable[[], UnitOfWork], Depends(get_uow_factory)],
     hasher: Annotated[PasswordHasher, Depends(get_hasher)],
     id_gen: Annotated[UserIdGenerator, Depends(get_id_gen)],
     auth_service: Annotated[AuthorizeService, Depends(get_authorize_service)],
 ) -> CreateUserUseCase:
     """Return CreateUser use case with injected ports."""
-    user = getattr(request.state, "user", None)
-    if user is None:
-        raise Exception("Unexpected error: user was not set with middleware.")
     return CreateUserUseCase(
         auth_service=auth_service,
         user=user,
@@ -107,14 +123,11 @@ def get_create_user_uc(
 
 
 def get_delete_user_uc(
-    request: Request,
+    user: Annotated[User, Depends(get_current_user)],
     uow_factory: Annotated[Callable[[], UnitOfWork], Depends(get_uow_factory)],
     auth_service: Annotated[AuthorizeService, Depends(get_authorize_service)],
 ) -> DeleteUserUseCase:
     """Return CreateUser use case with injected ports."""
-    user = getattr(request.state, "user", None)
-    if user is None:
-        raise Exception("Unexpected error: user was not set with middleware.")
     return DeleteUserUseCase(
         auth_service=auth_service,
         user=user,
@@ -122,15 +135,12 @@ def get_delete_user_uc(
     )
 
 def get_update_user_uc(
-    request: Request,
+    user: Annotated[User, Depends(get_current_user)],
     uow_factory: Annotated[Callable[[], UnitOfWork], Depends(get_uow_factory)],
     hasher: Annotated[PasswordHasher, Depends(get_hasher)],
     auth_service: Annotated[AuthorizeService, Depends(get_authorize_service)],
 ) -> UpdateUserUseCase:
     """Return CreateUser use case with injected ports."""
-    user = getattr(request.state, "user", None)
-    if user is None:
-        raise Exception("Unexpected error: user was not set with middleware.")
     return UpdateUserUseCase(
         auth_service=auth_service,
         user=user,
@@ -139,36 +149,33 @@ def get_update_user_uc(
     )
 
 
-def get_view_orders_uc(
-    request: Request,
-    auth_service: Annotated[AuthorizeService, Depends(get_authorize_service)],
-) -> ViewOrdersUseCase:
-    """Return CreateUser use case with injected ports."""
-    user = getattr(request.state, "user", None)
-    if user is None:
-        raise Exception("Unexpected error: user was not set with middleware.")
-    return ViewOrdersUseCase(
-        auth_service=auth_service,
-        user=user,
-    )
+def _authorized_uc_dep[U: (ViewOrdersUseCase, ViewPaymentsUseCase)](
+    uc_cls: type[U],
+) -> Callable[..., U]:
+    """Build a provider for use cases that need only the user and authorization.
 
-def get_view_payments_uc(
-    request: Request,
-    auth_service: Annotated[AuthorizeService, Depends(get_authorize_service)],
-) -> ViewPaymentsUseCase:
-    """Return CreateUser use case with injected ports."""
-    user = getattr(request.state, "user", None)
-    if user is None:
-        raise Exception("Unexpected error: user was not set with middleware.")
-    return ViewPaymentsUseCase(
-        auth_service=auth_service,
-        user=user,
-    )
+    Args:
+        uc_cls: Use case class to instantiate.
 
+    Returns:
+        Callable[..., U]: FastAPI dependency returning a new use case.
+    """
 
-auth_session_service: AuthenticateService = SQLAuthenticateService()
-def get_authnticate_service() -> AuthenticateService:
-    return auth_session_service
+    def dependency(
+        user: Annotated[User, Depends(get_current_user)],
+        auth_service: Annotated[AuthorizeService, Depends(get_authorize_service)],
+    ) -> U:
+        """Return use case with injected ports."""
+        return uc_cls(auth_service=auth_service, user=user)
 
+    return dependency
 
-jwt_service: TokenService = get_jwt_service()
\ No newline at end of file
+
+get_view_orders_uc = _authorized_uc_dep(ViewOrdersUseCase)
+get_view_payments_uc = _authorized_uc_dep(ViewPaymentsUseCase)
+
+
+@lru_cache(maxsize=1)
+def get_authnticate_service() -> AuthenticateService:
+    """Return shared session lookup service, its cache lives with the instance."""
+    return SQLAuthenticateService()
@@ -1,8 +1,8 @@
 from dataclasses import asdict
-from typing import Annotated
+from typing import Annotated, Final
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
@@ -37,6 +37,12 @@ from app.interface.http.utils import raise_for_presenter_400_state
 
 router = APIRouter()
 
+# Response never varies, serialize it once.
+_PAYMENTS_BODY: Final = ViewPaymentsResponse(
+    detail="You are allowed to view payments."
+).model_dump_json().encode()
+_EMPTY_DTO: Final = DTO()
+
 
 @router.get(
     "/payments",
@@ -49,15 +55,14 @@ router = APIRouter()
 )
 async def get_orders(
     uc: Annotated[ViewPaymentsUseCase, Depends(get_view_payments_uc)],
-) -> ViewPaymentsResponse:
+) -> Response:
     """Create a new user and return its public data."""
-    presenter = FastAPIAuthPresenter[DTO]()
-    await uc.execute(DTO(), presenter)
+    presenter: FastAPIAuthPresenter[DTO] = FastAPIAuthPresenter()
+    await uc.execute(_EMPTY_DTO, presenter)
 
-    if presenter.state is State.OK and isinstance(
-        presenter.response, DTO
-    ):
-        return ViewPaymentsResponse(detail="You are allowed to view payments.")
+    if presenter.state is State.OK:
+        assert isinstance(presenter.response, DTO)
+        return Response(content=_PAYMENTS_BODY, media_type="application/json")
 
     # Always raise for non-OK states to avoid returning None
     if isinstance(presenter.response, str):
@@ -1,20 +1,17 @@
-from dataclasses import asdict
 from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, status
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
-
-from app.domain.value_objects import UserId
 from app.application.dto import CreateUserInputDTO, CreateUserOutputDTO, DeleteUserInputDTO, DeleteUserOutputDTO, UpdateUserInputDTO, UpdateUserOutputDTO
-from app.interface.http.auth.ports import AuthenticateService
 from app.application.ports.presenters import State
 from app.application.use_cases.create_user import CreateUserUseCase
 from app.application.use_cases.delete_user import DeleteUserUseCase
 from app.application.use_cases.update_user import UpdateUserUseCase
+from app.domain.value_objects import UserId
 from app.interface.http.adapters.presenters import FastAPIAuthPresenter
-from app.interface.http.routes.dependencies import get_create_user_uc, get_delete_user_uc, get_update_user_uc, get_authnticate_service, get_session_factory
+from app.interface.http.auth.ports import AuthenticateService
+from app.interface.http.routes.dependencies import get_authnticate_service, get_create_user_uc, get_delete_user_uc, get_update_user_uc
 from app.interface.http.schemas import (
     CreateUserRequest,
     CreateUserResponse,
@@ -44,13 +41,23 @@ async def create_user(
     uc: Annotated[CreateUserUseCase, Depends(get_create_user_uc)],
 ) -> CreateUserResponse:
     """Create a new user and return its public data."""
-    presenter = FastAPIAuthPresenter[CreateUserOutputDTO]()
-    await uc.execute(CreateUserInputDTO(**body.model_dump(mode="python")), presenter)
+    presenter: FastAPIAuthPresenter[CreateUserOutputDTO] = FastAPIAuthPresenter()
+    dto = CreateUserInputDTO(
+        username=body.username,
+        email=body.email,
+        password=body.password,
+        role=body.role
+    )
+    await uc.execute(dto, presenter)
 
-    if presenter.state is State.OK and isinstance(
-        presenter.response, CreateUserOutputDTO
-    ):
-        return CreateUserResponse(**asdict(presenter.response))
+    if presenter.state is State.OK:
+        assert isinstance(presenter.response, CreateUserOutputDTO)
+        # Fields come from validated domain objects, skip re-validation.
+        return CreateUserResponse.model_construct(
+            id=presenter.response.id,
+            email=presenter.response.email,
+            role=presenter.response.role
+        )
 
     # Always raise for non-OK states to avoid returning None
     if isinstance(presenter.response, str):
@@ -62,6 +69,7 @@ async def create_user(
     "/users/{user_id}",
     status_code=status.HTTP_200_OK,
     responses={
+        400: {"description": "Bad request", "model": ErrorResponse},
         401: {"description": "Unauthorized", "model": ErrorResponse},
         403: {"description": "Forbidden", "model": ErrorResponse},
         404: {"description": "Not found", "model": ErrorResponse},
@@ -72,11 +80,12 @@ async def update_user(
     user_id: UUID,
     body: UpdateUserRequest,
     uc: Annotated[UpdateUserUseCase, Depends(get_update_user_uc)],
+    auth: Annotated[AuthenticateService, Depends(get_authnticate_service)],
 ) -> UpdateUserResponse:
     """Create a new user and return its public data."""
-    presenter = FastAPIAuthPresenter[UpdateUserOutputDTO]()
+    presenter: FastAPIAuthPresenter[UpdateUserOutputDTO] = FastAPIAuthPresenter()
     dto = UpdateUserInputDTO(
-        id=str(user_id),
+        id=user_id,
         username=body.username,
         password=body.password,
         email=body.email,
@@ -84,10 +93,11 @@ async def update_user(
     )
     await uc.execute(dto, presenter)
 
-    if presenter.state is State.OK and isinstance(
-        presenter.response, UpdateUserOutputDTO
-    ):
-        return UpdateUserResponse(
+    if presenter.state is State.OK:
+        assert isinstance(presenter.response, UpdateUserOutputDTO)
+        # Role and active flag may have changed, drop the cached sessions.
+        auth.invalidate_user(UserId.from_storage(user_id))
+        return UpdateUserResponse.model_construct(
             id=presenter.response.id,
             username=presenter.response.username,
             email=presenter.response.email,
@@ -113,19 +123,15 @@ async def delete_user(
     user_id: UUID,
     uc: Annotated[DeleteUserUseCase, Depends(get_delete_user_uc)],
     auth: Annotated[AuthenticateService, Depends(get_authnticate_service)],
-    session_factory: Annotated[async_sessionmaker[AsyncSession], Depends(get_session_factory)],
-
 ) -> DeleteUserResponse:
     """Create a new user and return its public data."""
-    presenter = FastAPIAuthPresenter[DeleteUserOutputDTO]()
-    await uc.execute(DeleteUserInputDTO(str(user_id)), presenter)
+    presenter: FastAPIAuthPresenter[DeleteUserOutputDTO] = FastAPIAuthPresenter()
+    await uc.execute(DeleteUserInputDTO(user_id), presenter)
 
-    if presenter.state is State.OK and isinstance(
-        presenter.response, DeleteUserOutputDTO
-    ):
-        async with session_factory() as db:
-            async with db.begin():
-                await auth.delete_user_session_by_user_id(db, UserId(user_id))
+    if presenter.state is State.OK:
+        assert isinstance(presenter.response, DeleteUserOutputDTO)
+        # Sessions are gone in the DB, stop serving them from the cache too.
+        auth.invalidate_user(UserId.from_storage(user_id))
         return DeleteUserResponse(detail=presenter.response.msg)
 
     # Always raise for non-OK states to avoid returning None
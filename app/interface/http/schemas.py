@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.domain.value_objects.constants import (
     RAW_PASSWORD_MAX_LEN,
@@ -11,18 +11,26 @@ from app.domain.value_objects.constants import (
 
 
 class ErrorResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     detail: str
 
 
 class Token(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     access_token: str
     token_type: str
 
 class LogoutResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     detail: str
 
 
 class CreateUserRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     username: str = Field(..., min_length=USERNAME_MIN_LEN, max_length=USERNAME_MAX_LEN)
     email: str = Field(..., min_length=EMAIL_MIN_LEN, max_length=EMAIL_MAX_LEN)
     password: str = Field(
@@ -32,28 +40,40 @@ class CreateUserRequest(BaseModel):
 
 
 class CreateUserResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     email: str = Field(..., min_length=EMAIL_MIN_LEN, max_length=EMAIL_MAX_LEN)
     role: str
 
 
 class DeleteUserResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     detail: str
 
 class UpdateUserRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     username: str|None = Field(default=None, min_length=USERNAME_MIN_LEN, max_length=USERNAME_MAX_LEN)
     password: str|None = Field(default=None, min_length=RAW_PASSWORD_MIN_LEN, max_length=RAW_PASSWORD_MAX_LEN)
     email: str|None = Field(default=None, min_length=EMAIL_MIN_LEN, max_length=EMAIL_MAX_LEN)
     role: str|None = None
 
 class UpdateUserResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     username: str = Field(..., min_length=USERNAME_MIN_LEN, max_length=USERNAME_MAX_LEN)
     email: str = Field(..., min_length=EMAIL_MIN_LEN, max_length=EMAIL_MAX_LEN)
     role: str
 
 class ViewOrdersResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     detail: str
 
 class ViewPaymentsResponse(BaseModel):
-    detail: str
\ No newline at end of file
+    model_config = ConfigDict(frozen=True)
+
+    detail: str
\ No newline at end of file
@@ -1,33 +1,29 @@
-from typing import NoReturn
+from types import MappingProxyType
+from typing import Final, NoReturn
 
 from fastapi import HTTPException, status
 
 from app.application.ports.presenters import Presenter, State
 
+_STATE_TO_HTTP: Final = MappingProxyType(
+    {
+        State.UNAUTHORIZED: (
+            status.HTTP_401_UNAUTHORIZED,
+            {"WWW-Authenticate": "Bearer"},
+        ),
+        State.FORBIDDEN: (status.HTTP_403_FORBIDDEN, None),
+        State.CONFLICT: (status.HTTP_409_CONFLICT, None),
+        State.ERROR: (status.HTTP_422_UNPROCESSABLE_ENTITY, None),
+        State.NOT_FOUND: (status.HTTP_404_NOT_FOUND, None),
+        State.BAD_RESPONSE: (status.HTTP_400_BAD_REQUEST, None),
+    }
+)
+
 
 def raise_for_presenter_400_state(p: Presenter) -> NoReturn:
     if not isinstance(p.response, str):
         raise ValueError("Wrong type for presenter response. str expected.")
-    match p.state:
-        case State.UNAUTHORIZED:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail=p.response,
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-        case State.FORBIDDEN:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN, detail=p.response
-            )
-        case State.CONFLICT:
-            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=p.response)
-        case State.ERROR:
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=p.response
-            )
-        case State.NOT_FOUND:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail=p.response
-            )
-
-    raise ValueError("Wrong presenter state")
+    if p.state is None or p.state not in _STATE_TO_HTTP:
+        raise ValueError("Wrong presenter state")
+    status_code, headers = _STATE_TO_HTTP[p.state]
+    raise HTTPException(status_code=status_code, detail=p.response, headers=headers)
@@ -15,19 +15,10 @@ from app.domain.exceptions.base import DomainError
 from app.domain.value_objects import Username, UserPasswordHash, UserRole, Email
 from app.infrastructure.db.sqlalchemy.adapters import UoWSQL, UUIDv4Generator
 
-cfg = get_settings()
-engine = create_async_engine(str(cfg.DB_URL), pool_pre_ping=True)
-async_session = async_sessionmaker(engine, expire_on_commit=False)
-
-
-def uow_factory() -> UnitOfWork:
-    """Return UnitOfWork bound to the async session."""
-    return UoWSQL(async_session)
-
-
 async def main() -> int:
     """Bootstrap: create an admin user once"""
 
+    cfg = get_settings()
     username = cfg.EFFECTIVE_MOBILE_TEST_APP_BOOTSTRAP_ADMIN_USERNAME
     password_hash = (
         cfg.EFFECTIVE_MOBILE_TEST_APP_BOOTSTRAP_ADMIN_PASSWORD_HASH.get_secret_value()
@@ -54,13 +45,17 @@ async def main() -> int:
             f"[effective_mobile_test_app_bootstrap] User with provided parameters cannot be created: {e}"
         )
 
+    engine = create_async_engine(str(cfg.DB_URL), pool_pre_ping=True)
+    uow: UnitOfWork = UoWSQL(async_sessionmaker(engine, expire_on_commit=False))
     try:
-        async with uow_factory() as uow:
-            repo: UserRepository = uow.get_repo(UserRepository)
+        async with uow:
+            repo: UserRepository = uow.get_user_repo()
             await repo.add(user)
     except IntegrityUserError:
         print("[effective_mobile_test_app_bootstrap] User already exists")
         sys.exit(0)
+    finally:
+        await engine.dispose()
 
     print(
         f"[effective_mobile_test_app_bootstrap] Admin created (id={user.id}, user={user.username})"
@@ -3,20 +3,32 @@
 
 import argparse
 import getpass
+import os
 import yaml
 from pathlib import Path
+from typing import Final
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
+# Distinguishes an absent key from one set to an empty value.
+_MISSING: Final = object()
+
 
 def parse_dotenv(path: Path) -> dict[str, str]:
     """Return key-value pairs from .env like file (KEY=VALUE per line)."""
 
     data: dict[str, str] = {}
-    for line in path.read_text().splitlines():
-        if not line or line.lstrip().startswith("#"):
-            continue
-        if "=" not in line:
-            continue
-        k, v = line.split("=", 1)
-        data[k.strip()] = v.strip()
+    with path.open(encoding="utf-8") as fh:
+        for line in fh:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            k, sep, v = line.partition("=")
+            if sep:
+                data[k.strip()] = v.strip()
     return data
 
 
@@ -30,7 +42,7 @@ def main() -> None:
     args = parser.parse_args()
 
     with open(args.yml, "r") as fp:
-        compose_data = yaml.safe_load(fp)
+        compose_data = yaml.load(fp, Loader=SafeLoader)
         secrets = list(compose_data.get('secrets', {}).keys())
 
     out_dir = Path(args.out_dir)
@@ -41,13 +53,19 @@ def main() -> None:
     )
 
     for name in secrets:
-        value = predefined.get(name) or getpass.getpass(f"Secret '{name}': ").strip()
+        value = predefined.get(name, _MISSING)
+        if value is _MISSING:
+            value = getpass.getpass(f"Secret '{name}': ").strip()
 
         secret_file = out_dir / name
-        if secret_file.exists():
-            secret_file.chmod(0o640)
-        secret_file.write_text(value)
-        secret_file.chmod(0o400)
+        # Recreate instead of chmod-ing the read-only file; a freshly
+        # created file is writable through its fd whatever its mode.
+        secret_file.unlink(missing_ok=True)
+        fd = os.open(secret_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o400)
+        try:
+            os.write(fd, value.encode("utf-8"))
+        finally:
+            os.close(fd)
 
     print(f"[create_compose_secrets] wrote {len(secrets)} secrets to {out_dir}")
 
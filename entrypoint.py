@@ -3,6 +3,7 @@
 
 import argparse
 import os
+import shutil
 import subprocess
 import sys
 import time
@@ -10,19 +11,25 @@ from socket import AF_INET, SOCK_STREAM, socket
 
 
 def wait_for_db(host: str, port: int, timeout: int = 30) -> None:
-    """Wait until TCP host:port is reachable or timeout."""
-    start = time.time()
+    """Wait until TCP host:port is reachable or timeout.
+
+    Retries with exponential backoff from 50 ms up to 1 s, so a DB that comes
+    up quickly is noticed without waiting out a full polling interval.
+    """
+    start = time.monotonic()
+    delay = 0.05
     while True:
         try:
             with socket(AF_INET, SOCK_STREAM) as s:
-                s.settimeout(2)
+                s.settimeout(0.5)
                 s.connect((host, port))
-                print(f"[entrypoint] DB ready in {time.time() - start:.1f}s")
+                print(f"[entrypoint] DB ready in {time.monotonic() - start:.1f}s")
                 return
         except OSError:
-            if time.time() - start > timeout:
+            if time.monotonic() - start > timeout:
                 sys.exit(f"[entrypoint] DB {host}:{port} unreachable")
-            time.sleep(1)
+            time.sleep(delay)
+            delay = min(delay * 2, 1.0)
 
 
 def run_cmd(cmd: list[str]) -> None:
@@ -44,23 +51,13 @@ def main() -> int:
     if not cmd:
             sys.exit("[entrypoint] no CMD provided")
     
-    db_host_key = next((key for key in os.environ if key.endswith("DB_HOST")), None)
-    # db_port_key = next((key for key in os.environ if key.endswith("DB_PORT")), None)
-
-    if not db_host_key:
-        raise RuntimeError("[entrypoint] DB_HOST var not found")
-
-    host = os.getenv(db_host_key)
+    # Same variables the app settings read.
+    host = os.getenv("DB_HOST")
     if not host:
-        raise RuntimeError(f"[entrypoint] {db_host_key} is not set")
-
-
-    # if not db_port_key:
-    #     port = 5432
-    # else:
-    #     port = os.getenv(db_port_key, 5432)
+        raise RuntimeError("[entrypoint] DB_HOST is not set")
+    port = int(os.getenv("DB_PORT", "5432"))
 
-    wait_for_db(host, 5432, 60)
+    wait_for_db(host, port, 60)
     run_cmd(["alembic", "upgrade", "head"])
 
     bootstrap_flag = os.getenv("EFFECTIVE_MOBILE_TEST_APP_BOOTSTRAP_FLAG")
@@ -73,7 +70,10 @@ def main() -> int:
     else:
         bootstrap()
 
-    os.execvp(cmd[0], cmd)
+    exe = shutil.which(cmd[0])
+    if exe is None:
+        sys.exit(f"[entrypoint] command not found: {cmd[0]}")
+    os.execv(exe, cmd)
 
 
 if __name__ == "__main__":  # pragma: no cover
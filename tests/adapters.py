@@ -1,5 +1,5 @@
-from typing import TypeVar, Callable, ClassVar
-from dataclasses import dataclass, asdict
+from typing import TypeVar, cast
+from dataclasses import dataclass
 
 from app.domain.entities.user import User
 from app.domain.entities.user.repo import Repository, UserRepository
@@ -7,13 +7,13 @@ from app.domain.value_objects import UserId, UserPasswordHash, UserRawPassword,
 
 from app.domain.value_objects.constants import HASH_LEN
 from app.application.dto.base import DTO
-from app.application.dto import AuthResponseDTO, CreateUserOutputDTO, CredentialDTO
+from app.application.dto import AuthResponseDTO, CreateUserOutputDTO, UpdateUserOutputDTO
 from app.application.ports.presenters import Presenter, AuthPresenter
 from app.application.ports.uow import UnitOfWork
 from app.application.ports import AuthorizeService, PasswordVerifier, PasswordHasher, UserIdGenerator
-from app.application.exceptions import IntegrityUserError, NotAuthenticatedError, NotAuthorizedError
+from app.application.exceptions import IntegrityUserError, NotAuthorizedError
 
-@dataclass
+@dataclass(slots=True)
 class TestUser:
     """Test user data structure."""
     id: str
@@ -27,27 +27,37 @@ class FakePasswordVerifier(PasswordVerifier):
     """Fake password verifier that compares hash with raw for testing."""
     
     def __init__(self, initial_users: list[TestUser]) -> None:
-        self.hash_to_raw = {}
-        self.hash_to_raw = {
-            UserPasswordHash(user.password_hash.encode()): UserRawPassword(user.raw_password) 
+        self.hash_to_raw: dict[bytes, str] = {
+            user.password_hash.encode(): user.raw_password
             for user in initial_users
         }
     
     def verify(self, raw_password: UserRawPassword, hashed_password: UserPasswordHash) -> bool:
         """Verify password by comparing with known hash-to-raw mapping."""
-        expected_raw = self.hash_to_raw.get(hashed_password)
-        return expected_raw == raw_password if expected_raw else False
+        expected_raw = self.hash_to_raw.get(hashed_password.value)
+        return expected_raw is not None and expected_raw == raw_password.value
 
 
 class FakeAuthenticationPresenter(Presenter[AuthResponseDTO]):
     """Test presenter implementation."""
 
+    __slots__ = ()
+
 class FakeAuthorizationPresenter(AuthPresenter[DTO]):
     """Test presenter implementation."""    
 
+    __slots__ = ()
+
 class FakeCreateUserPresenter(AuthPresenter[CreateUserOutputDTO]):
     """Test Auth presenter implementation."""
 
+    __slots__ = ()
+
+class FakeUpdateUserPresenter(AuthPresenter[UpdateUserOutputDTO]):
+    """Test Auth presenter implementation."""
+
+    __slots__ = ()
+
 
 class InMemoryUserRepository(UserRepository):
     """In-memory implementation of UserRepository."""
@@ -57,15 +67,17 @@ class InMemoryUserRepository(UserRepository):
         self.users_by_email:dict[Email,User] = {}
 
         for user in initial_users:
+            user_id = UserId.from_str(user.id)
+            email = Email(user.email)
             user_instance = User.from_storage(
-                id=UserId.from_str(user.id),
-                email=Email(user.email),
+                id=user_id,
+                email=email,
                 username=Username(user.username),
                 password_hash=UserPasswordHash(user.password_hash.encode()),
                 role=UserRole(user.role)
             )
-            self.users_by_id[UserId.from_str(user.id)] = user_instance
-            self.users_by_email[Email(user.email)] = user_instance
+            self.users_by_id[user_id] = user_instance
+            self.users_by_email[email] = user_instance
     
     async def get_by_id(self, user_id: UserId) -> User | None:
         """Get user by ID."""
@@ -81,21 +93,23 @@ class InMemoryUserRepository(UserRepository):
             raise IntegrityUserError
         self.users_by_id[user.id] = user
         self.users_by_email[user.email] = user
+
+    async def save(self, user: User) -> User:
+        """Update existing user."""
+        self.users_by_id[user.id] = user
+        self.users_by_email[user.email] = user
+        return user
         
         
 R = TypeVar("R", bound=Repository)
-type RepoFactory[R: Repository] = Callable
 
 
 class FakeUoW(UnitOfWork):
     """Unit-of-Work adapter for SQLite testing."""
 
-    _REGISTRY: ClassVar[dict[type[Repository], RepoFactory]] = {
-        UserRepository: InMemoryUserRepository,
-    }
-
     def __init__(self, initial_users: list[TestUser]):
         self.initial_users = initial_users
+        self._user_repo: InMemoryUserRepository | None = None
 
     async def _open(self) -> None:
         """Begin a new transactional session."""
@@ -114,10 +128,14 @@ class FakeUoW(UnitOfWork):
         pass
 
     def get_repo(self, iface: type[R]) -> R:
-        repo_class = self._REGISTRY[iface]
-        repo = repo_class(self.initial_users)
-        from typing import cast
-        return cast(R, repo)
+        if iface is not UserRepository:
+            raise KeyError(f"Repository not registered: {iface!r}")
+        return cast(R, self.get_user_repo())
+
+    def get_user_repo(self) -> UserRepository:
+        if self._user_repo is None:
+            self._user_repo = InMemoryUserRepository(self.initial_users)
+        return self._user_repo
 
 
 class FakeAuthService(AuthorizeService):
@@ -127,7 +145,7 @@ class FakeAuthService(AuthorizeService):
         self.is_role_ensured = is_role_ensured
         # self.is_user_found = is_user_found
         
-    def ensure_role(self, user_id: UserId, user_role: UserRole, required_roles: list[UserRole]) -> None:
+    def ensure_role(self, user_id: UserId, user_role: UserRole, required_roles: frozenset[UserRole]) -> None:
         """Check if user has required role."""
         if not self.is_role_ensured:
             raise NotAuthorizedError(f"User role {user_role} does not match target roles {required_roles}")
@@ -137,13 +155,13 @@ class FakePasswordHasher(PasswordHasher):
     
     def __init__(self, hash_prefix: str = "hashed_"):
         self.hash_prefix = hash_prefix
+        self._prefix_b = hash_prefix.encode()
         
     def hash(self, raw_password: UserRawPassword) -> UserPasswordHash:
         """Create a fake hash from raw password."""
 
-        fake_hash = (self.hash_prefix + raw_password.value)[:HASH_LEN]
-        fake_hash = fake_hash.ljust(HASH_LEN, 'x')
-        return UserPasswordHash(fake_hash.encode())
+        fake_hash = (self._prefix_b + raw_password.value.encode())[:HASH_LEN]
+        return UserPasswordHash(fake_hash.ljust(HASH_LEN, b'x'))
     
 class FakeIdGenerator(UserIdGenerator):
     """Test ID generator implementation."""
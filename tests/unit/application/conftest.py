@@ -6,6 +6,7 @@ from app.domain.value_objects.constants import HASH_LEN
 
 from app.application.use_cases.authenticate_user import AuthenticateUserUseCase
 from app.application.use_cases.create_user import CreateUserUseCase
+from app.application.use_cases.update_user import UpdateUserUseCase
 
 from tests.adapters import (
     TestUser, 
@@ -14,6 +15,7 @@ from tests.adapters import (
     FakePasswordVerifier, 
     FakeAuthenticationPresenter, 
     FakeCreateUserPresenter, 
+    FakeUpdateUserPresenter,
     FakeAuthService,
     FakePasswordHasher,
     FakeIdGenerator
@@ -30,7 +32,7 @@ def current_user():
 
     )
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def initial_users():
     """Fixture with initial test users"""
     return [
@@ -55,12 +57,25 @@ def initial_users():
 
 @pytest.fixture
 def uow_factory(initial_users):
-    """UoW factory fixture."""
+    """UoW factory fixture sharing one in-memory store within a test."""
+    uow = FakeUoW(initial_users)
     def factory():
-        return FakeUoW(initial_users)
+        return uow
     return factory
 
 
+@pytest.fixture
+def auth_presenter():
+    """Fresh authentication presenter per test."""
+    return FakeAuthenticationPresenter()
+
+
+@pytest.fixture
+def create_user_presenter():
+    """Fresh create-user presenter per test."""
+    return FakeCreateUserPresenter()
+
+
 @pytest.fixture
 def password_verifier(initial_users):
     """Password verifier fixture."""
@@ -72,17 +87,57 @@ def authenticate_use_case(uow_factory, password_verifier):
     return AuthenticateUserUseCase(uow_factory, password_verifier)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def password_hasher():
     """Password hasher fixture."""
     return FakePasswordHasher()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def id_generator():
     """ID generator fixture."""
     return FakeIdGenerator()
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def successful_auth_service():
     return FakeAuthService(is_role_ensured=True)
+
+
+@pytest.fixture
+def create_user_uc(
+    current_user,
+    successful_auth_service,
+    uow_factory,
+    password_hasher,
+    id_generator,
+):
+    """CreateUserUseCase fixture authorized for the current user."""
+    return CreateUserUseCase(
+        auth_service=successful_auth_service,
+        user=current_user,
+        uow_factory=uow_factory,
+        hasher=password_hasher,
+        id_gen=id_generator
+    )
+
+
+@pytest.fixture
+def update_user_uc(
+    current_user,
+    successful_auth_service,
+    uow_factory,
+    password_hasher,
+):
+    """UpdateUserUseCase fixture authorized for the current user."""
+    return UpdateUserUseCase(
+        auth_service=successful_auth_service,
+        user=current_user,
+        uow_factory=uow_factory,
+        hasher=password_hasher
+    )
+
+
+@pytest.fixture
+def update_user_presenter():
+    """Fresh update-user presenter per test."""
+    return FakeUpdateUserPresenter()
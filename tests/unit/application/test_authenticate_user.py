@@ -8,74 +8,70 @@ from tests.adapters import TestUser, FakeAuthenticationPresenter
 
 
 @pytest.mark.asyncio
-async def test_successful_authentication(authenticate_use_case:AuthenticateUserUseCase, initial_users:list[TestUser]):
+async def test_successful_authentication(authenticate_use_case:AuthenticateUserUseCase, initial_users:list[TestUser], auth_presenter:FakeAuthenticationPresenter):
     """Test successful user authentication."""
     test_user = initial_users[0]
     auth_request = AuthRequestDTO(
         email=test_user.email,
         raw_password=test_user.raw_password
     )
-    presenter = FakeAuthenticationPresenter()
-    
-    await authenticate_use_case.execute(auth_request, presenter)
+
+    await authenticate_use_case.execute(auth_request, auth_presenter)
     
-    assert presenter.state == State.OK
-    assert isinstance(presenter.response, AuthResponseDTO)
-    assert presenter.response.user_id == test_user.id
-    assert presenter.response.email == test_user.email
-    assert presenter.response.role == test_user.role
+    assert auth_presenter.state == State.OK
+    assert isinstance(auth_presenter.response, AuthResponseDTO)
+    assert auth_presenter.response.user_id == test_user.id
+    assert auth_presenter.response.email == test_user.email
+    assert auth_presenter.response.role == test_user.role
 
 
 @pytest.mark.asyncio
-async def test_authentication_with_wrong_password(authenticate_use_case:AuthenticateUserUseCase, initial_users:list[TestUser]):
+async def test_authentication_with_wrong_password(authenticate_use_case:AuthenticateUserUseCase, initial_users:list[TestUser], auth_presenter:FakeAuthenticationPresenter):
     """Test authentication fails with wrong password."""
     test_user = initial_users[0]
     auth_request = AuthRequestDTO(
         email=test_user.email,
         raw_password=initial_users[0].raw_password+"x"
     )
-    presenter = FakeAuthenticationPresenter()
-    
-    await authenticate_use_case.execute(auth_request, presenter)
+
+    await authenticate_use_case.execute(auth_request, auth_presenter)
     
-    assert presenter.state == State.UNAUTHORIZED
-    assert presenter.response == "Invalid credentials"
+    assert auth_presenter.state == State.UNAUTHORIZED
+    assert auth_presenter.response == "Invalid credentials"
 
 
 @pytest.mark.asyncio
-async def test_authentication_with_nonexistent_user(authenticate_use_case:AuthenticateUserUseCase):
+async def test_authentication_with_nonexistent_user(authenticate_use_case:AuthenticateUserUseCase, auth_presenter:FakeAuthenticationPresenter):
     """Test authentication fails with non-existent user."""
 
     auth_request = AuthRequestDTO(
         email="nonexistent_user@email.com",
         raw_password="any_password"
     )
-    presenter = FakeAuthenticationPresenter()
-    
-    await authenticate_use_case.execute(auth_request, presenter)
+
+    await authenticate_use_case.execute(auth_request, auth_presenter)
     
-    assert presenter.state == State.UNAUTHORIZED
-    assert presenter.response == "Invalid credentials"
+    assert auth_presenter.state == State.UNAUTHORIZED
+    assert auth_presenter.response == "Invalid credentials"
 
 
 @pytest.mark.asyncio
-async def test_authentication_with_invalid_email_format(authenticate_use_case:AuthenticateUserUseCase):
+async def test_authentication_with_invalid_email_format(authenticate_use_case:AuthenticateUserUseCase, auth_presenter:FakeAuthenticationPresenter):
     """Test authentication fails with invalid email format."""
 
     auth_request = AuthRequestDTO(
         email="",
         raw_password="testpass123"
     )
-    presenter = FakeAuthenticationPresenter()
-    
-    await authenticate_use_case.execute(auth_request, presenter)
+
+    await authenticate_use_case.execute(auth_request, auth_presenter)
     
-    assert presenter.state == State.UNAUTHORIZED
-    assert presenter.response == "Invalid credentials"
+    assert auth_presenter.state == State.UNAUTHORIZED
+    assert auth_presenter.response == "Invalid credentials"
 
 
 @pytest.mark.asyncio
-async def test_authentication_with_invalid_password_format(authenticate_use_case:AuthenticateUserUseCase, initial_users:list[TestUser]):
+async def test_authentication_with_invalid_password_format(authenticate_use_case:AuthenticateUserUseCase, initial_users:list[TestUser], auth_presenter:FakeAuthenticationPresenter):
     """Test authentication fails with invalid password format."""
 
     test_user = initial_users[0]
@@ -83,32 +79,30 @@ async def test_authentication_with_invalid_password_format(authenticate_use_case
         email=test_user.email,
         raw_password=""
     )
-    presenter = FakeAuthenticationPresenter()
-    
-    await authenticate_use_case.execute(auth_request, presenter)
+
+    await authenticate_use_case.execute(auth_request, auth_presenter)
     
-    assert presenter.state == State.UNAUTHORIZED
-    assert presenter.response == "Invalid credentials"
+    assert auth_presenter.state == State.UNAUTHORIZED
+    assert auth_presenter.response == "Invalid credentials"
 
 
 @pytest.mark.asyncio
-async def test_authentication_with_wrong_email_and_password(authenticate_use_case:AuthenticateUserUseCase):
+async def test_authentication_with_wrong_email_and_password(authenticate_use_case:AuthenticateUserUseCase, auth_presenter:FakeAuthenticationPresenter):
     """Test authentication fails with both wrong email and password."""
 
     auth_request = AuthRequestDTO(
         email="wrong_email@email.com",
         raw_password="wrong_password"
     )
-    presenter = FakeAuthenticationPresenter()
-    
-    await authenticate_use_case.execute(auth_request, presenter)
+
+    await authenticate_use_case.execute(auth_request, auth_presenter)
     
-    assert presenter.state == State.UNAUTHORIZED
-    assert presenter.response == "Invalid credentials"
+    assert auth_presenter.state == State.UNAUTHORIZED
+    assert auth_presenter.response == "Invalid credentials"
 
 
 @pytest.mark.asyncio
-async def test_authentication_with_case_sensitive_email(authenticate_use_case:AuthenticateUserUseCase, initial_users:list[TestUser]):
+async def test_authentication_with_case_sensitive_email(authenticate_use_case:AuthenticateUserUseCase, initial_users:list[TestUser], auth_presenter:FakeAuthenticationPresenter):
     """Test that email is case-sensitive."""
 
     test_user = initial_users[0]
@@ -116,9 +110,8 @@ async def test_authentication_with_case_sensitive_email(authenticate_use_case:Au
         email=test_user.email.upper(),
         raw_password=test_user.raw_password
     )
-    presenter = FakeAuthenticationPresenter()
-    
-    await authenticate_use_case.execute(auth_request, presenter)
+
+    await authenticate_use_case.execute(auth_request, auth_presenter)
     
-    assert presenter.state == State.UNAUTHORIZED
-    assert presenter.response == "Invalid credentials"
\ No newline at end of file
+    assert auth_presenter.state == State.UNAUTHORIZED
+    assert auth_presenter.response == "Invalid credentials"
\ No newline at end of file
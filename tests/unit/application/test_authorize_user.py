@@ -8,6 +8,14 @@ from app.application.use_cases import CreateUserUseCase
 
 from tests.adapters import FakeAuthService, FakeCreateUserPresenter
 
+# Frozen, safe to share across tests. Role checks run before validation.
+_INVALID_USERNAME_DTO = CreateUserInputDTO(
+    username="",
+    email="test@email.com",
+    password="password123",
+    role=UserRole.USER
+)
+
 
 @pytest.mark.asyncio
 async def test_authorize_success(
@@ -15,7 +23,8 @@ async def test_authorize_success(
     successful_auth_service,
     uow_factory,
     password_hasher,
-    id_generator):
+    id_generator,
+    create_user_presenter: FakeCreateUserPresenter):
     """Test authentication fails with wrong password."""
     
     uc = CreateUserUseCase(
@@ -26,16 +35,9 @@ async def test_authorize_success(
         id_generator
     )
 
-    presenter = FakeCreateUserPresenter()
-    dto = CreateUserInputDTO(
-        username="",
-        email="test@email.com",
-        password="password123",
-        role=UserRole.USER
-    )
-    await uc.execute(dto, presenter)
+    await uc.execute(_INVALID_USERNAME_DTO, create_user_presenter)
     
-    assert presenter.state is not State.FORBIDDEN
+    assert create_user_presenter.state is not State.FORBIDDEN
 
 
 @pytest.mark.asyncio
@@ -43,7 +45,8 @@ async def test_authorize_insufficient_role(
     current_user, 
     uow_factory,
     password_hasher,
-    id_generator):
+    id_generator,
+    create_user_presenter: FakeCreateUserPresenter):
     """Test authorization fails when user has insufficient role."""
     
     auth_service = FakeAuthService(
@@ -57,15 +60,7 @@ async def test_authorize_insufficient_role(
             password_hasher,
             id_generator
         )    
-    presenter = FakeCreateUserPresenter()
-    dto = CreateUserInputDTO(
-        username="",
-        email="test@email.com",
-        password="password123",
-        role=UserRole.USER
-    )
-    
-    await uc.execute(dto, presenter)
+    await uc.execute(_INVALID_USERNAME_DTO, create_user_presenter)
     
-    assert presenter.state == State.FORBIDDEN
-    assert presenter.response == "Forbidden"
+    assert create_user_presenter.state == State.FORBIDDEN
+    assert create_user_presenter.response == "Forbidden"
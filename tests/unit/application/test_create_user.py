@@ -4,71 +4,49 @@ from app.domain.entities.user.repo import UserRepository
 from app.domain.value_objects import UserRole, Email
 
 from app.application.dto import CreateUserInputDTO, CreateUserOutputDTO
-from app.application.ports import UnitOfWork, State
+from app.application.ports import State
 from app.application.use_cases import CreateUserUseCase
 
 from tests.adapters import FakeCreateUserPresenter, TestUser
 
+NEW_USER_EMAIL = Email("new@email.com")
+
+
 @pytest.mark.asyncio
 async def test_create_user_success(
-    current_user,
-    successful_auth_service,
+    create_user_uc: CreateUserUseCase,
+    create_user_presenter: FakeCreateUserPresenter,
     uow_factory,
-    password_hasher,
-    id_generator,
 ):
     """Test successful user creation by admin."""
 
-    use_case = CreateUserUseCase(
-        auth_service=successful_auth_service,
-        user=current_user,
-        uow_factory=uow_factory,
-        hasher=password_hasher,
-        id_gen=id_generator
-    )
-    
     dto = CreateUserInputDTO(
         username="new_user",
-        email="new@email.com",
+        email=NEW_USER_EMAIL.value,
         password="secure_password123",
         role=UserRole.USER
     )
-    presenter = FakeCreateUserPresenter()
-    
-    await use_case.execute(dto, presenter)
+    await create_user_uc.execute(dto, create_user_presenter)
     
-    assert presenter.state is State.OK
-    assert isinstance(presenter.response, CreateUserOutputDTO)
-    assert presenter.response.email == dto.email
-    assert presenter.response.role == dto.role
+    assert create_user_presenter.state is State.OK
+    assert isinstance(create_user_presenter.response, CreateUserOutputDTO)
+    assert create_user_presenter.response.email == dto.email
+    assert create_user_presenter.response.role == dto.role
     
-    async with uow_factory() as uow:
-        uow: UnitOfWork
-        repo = uow.get_repo(UserRepository)
-        new_user = repo.get_by_email(Email(dto.email))
+    repo = uow_factory().get_repo(UserRepository)
+    new_user = await repo.get_by_email(NEW_USER_EMAIL)
     
     assert new_user is not None
 
 
 @pytest.mark.asyncio
 async def test_create_user_conflict(
-    current_user,
-    successful_auth_service,
-    uow_factory,
-    password_hasher,
-    id_generator,
+    create_user_uc: CreateUserUseCase,
+    create_user_presenter: FakeCreateUserPresenter,
     initial_users: list[TestUser]
 ):
     """Test user creation fails when username already exists."""
 
-    use_case = CreateUserUseCase(
-        auth_service=successful_auth_service,
-        user=current_user,
-        uow_factory=uow_factory,
-        hasher=password_hasher,
-        id_gen=id_generator
-    )
-    
     existing_user = initial_users[0]
     dto = CreateUserInputDTO(
         username=existing_user.username,
@@ -76,108 +54,38 @@ async def test_create_user_conflict(
         password="password123",
         role=UserRole.USER
     )
-    presenter = FakeCreateUserPresenter()
-    
-    await use_case.execute(dto, presenter)
+    await create_user_uc.execute(dto, create_user_presenter)
     
-    assert presenter.state == State.CONFLICT
-    assert presenter.response == "User with given unique atributes already exists"
+    assert create_user_presenter.state == State.CONFLICT
+    assert create_user_presenter.response == "User with given unique atributes already exists"
 
 
 @pytest.mark.asyncio
-async def test_create_user_validation_error(
-    successful_auth_service,
-    current_user,
-    uow_factory,
-    password_hasher,
-    id_generator
+@pytest.mark.parametrize(
+    ("username", "password", "role"),
+    [
+        pytest.param("", "password123", UserRole.USER, id="empty_username"),
+        pytest.param("new_user", "password123", "INVALID_ROLE", id="invalid_role"),
+        pytest.param("new_user", "", UserRole.USER, id="empty_password"),
+    ],
+)
+async def test_create_user_invalid_input(
+    username: str,
+    password: str,
+    role: str,
+    create_user_uc: CreateUserUseCase,
+    create_user_presenter: FakeCreateUserPresenter,
 ):
     """Test user creation fails with invalid input data."""
 
-    use_case = CreateUserUseCase(
-        auth_service=successful_auth_service,
-        user=current_user,
-        uow_factory=uow_factory,
-        hasher=password_hasher,
-        id_gen=id_generator
-    )
-    
     dto = CreateUserInputDTO(
-        username="",
+        username=username,
         email="test@email.com",
-        password="password123",
-        role=UserRole.USER
-    )
-    presenter = FakeCreateUserPresenter()
-    
-    await use_case.execute(dto, presenter)
-    
-    assert presenter.state == State.ERROR
-    assert isinstance(presenter.response, str)
-    assert "User with provided parameters cannot be created" in presenter.response
-
-
-@pytest.mark.asyncio
-async def test_create_user_invalid_role(
-    successful_auth_service,
-    current_user,
-    uow_factory,
-    password_hasher,
-    id_generator
-):
-    """Test user creation fails with invalid role."""
-
-    use_case = CreateUserUseCase(
-        auth_service=successful_auth_service,
-        user=current_user,
-        uow_factory=uow_factory,
-        hasher=password_hasher,
-        id_gen=id_generator
+        password=password,
+        role=role
     )
+    await create_user_uc.execute(dto, create_user_presenter)
     
-    dto = CreateUserInputDTO(
-        username="new_user",
-        email="test@email.com",
-        password="password123",
-        role="INVALID_ROLE"
-    )
-    presenter = FakeCreateUserPresenter()
-    
-    await use_case.execute(dto, presenter)
-    
-    assert presenter.state == State.ERROR
-    assert isinstance(presenter.response, str)
-    assert "User with provided parameters cannot be created" in presenter.response
-
-
-@pytest.mark.asyncio
-async def test_create_user_empty_password(
-    successful_auth_service,
-    current_user,
-    uow_factory,
-    password_hasher,
-    id_generator
-):
-    """Test user creation fails with empty password."""
-
-    use_case = CreateUserUseCase(
-        auth_service=successful_auth_service,
-        user=current_user,
-        uow_factory=uow_factory,
-        hasher=password_hasher,
-        id_gen=id_generator
-    )
-    
-    dto = CreateUserInputDTO(
-        username="new_user",
-        email="test@email.com",
-        password="",
-        role=UserRole.USER
-    )
-    presenter = FakeCreateUserPresenter()
-    
-    await use_case.execute(dto, presenter)
-    
-    assert presenter.state == State.ERROR
-    assert isinstance(presenter.response, str)
-    assert "User with provided parameters cannot be created" in presenter.response
\ No newline at end of file
+    assert create_user_presenter.state == State.ERROR
+    assert isinstance(create_user_presenter.response, str)
+    assert "User with provided parameters cannot be created" in create_user_presenter.response
@@ -0,0 +1,87 @@
+from uuid import UUID
+
+import pytest
+
+from app.application.dto import UpdateUserInputDTO, UpdateUserOutputDTO
+from app.application.ports import State
+from app.application.use_cases.update_user import UpdateUserUseCase
+from app.domain.value_objects import UserId
+from tests.adapters import FakeUpdateUserPresenter, TestUser
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("as_uuid", [False, True])
+async def test_update_user_success(
+    as_uuid: bool,
+    update_user_uc: UpdateUserUseCase,
+    update_user_presenter: FakeUpdateUserPresenter,
+    initial_users: list[TestUser]
+):
+    """Test successful user update by admin."""
+
+    user_id = initial_users[0].id
+    dto = UpdateUserInputDTO(
+        id=UUID(user_id) if as_uuid else user_id,
+        username="renamed_user",
+        email=None,
+        password=None,
+        role=None
+    )
+    await update_user_uc.execute(dto, update_user_presenter)
+
+    assert update_user_presenter.state is State.OK
+    assert isinstance(update_user_presenter.response, UpdateUserOutputDTO)
+    assert update_user_presenter.response.username == dto.username
+
+
+@pytest.mark.asyncio
+async def test_update_user_no_fields(
+    current_user,
+    successful_auth_service,
+    password_hasher,
+    update_user_presenter: FakeUpdateUserPresenter,
+    initial_users: list[TestUser]
+):
+    """Test update without fields is rejected before opening UoW."""
+
+    def failing_factory():
+        raise AssertionError("UoW must not be opened")
+
+    use_case = UpdateUserUseCase(
+        auth_service=successful_auth_service,
+        user=current_user,
+        uow_factory=failing_factory,
+        hasher=password_hasher
+    )
+
+    dto = UpdateUserInputDTO(
+        id=initial_users[0].id,
+        username=None,
+        email=None,
+        password=None,
+        role=None
+    )
+    await use_case.execute(dto, update_user_presenter)
+
+    assert update_user_presenter.state is State.BAD_RESPONSE
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("user_id", ["not-a-uuid", str(UserId.new())])
+async def test_update_user_not_found(
+    update_user_uc: UpdateUserUseCase,
+    update_user_presenter: FakeUpdateUserPresenter,
+    user_id: str
+):
+    """Test update fails for malformed or unknown user id."""
+
+    dto = UpdateUserInputDTO(
+        id=user_id,
+        username="renamed_user",
+        email=None,
+        password=None,
+        role=None
+    )
+    await update_user_uc.execute(dto, update_user_presenter)
+
+    assert update_user_presenter.state is State.NOT_FOUND